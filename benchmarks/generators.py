@@ -0,0 +1,81 @@
+import random
+from collections import deque
+
+from family_tree.member import Member
+from family_tree.tree import FamilyTree
+
+NAME_POOL = ("Anga", "Shan", "Chit", "Amba", "Ish", "Vich", "Lika", "Aras", "Chitra", "Satya")
+
+
+def unique_names(member_id):
+    return "Member{}".format(member_id)
+
+
+def colliding_names(member_id):
+    return NAME_POOL[member_id % len(NAME_POOL)]
+
+
+def build_tree(size, children_per_couple, marriage_rate, names=unique_names, seed=0):
+    # grows a tree couple by couple, breadth first, through the public member
+    # API; children marry someone from outside the tree with marriage_rate
+    rng = random.Random(seed)
+    tree = FamilyTree()
+    next_id = [1]
+
+    def new_member(gender):
+        member = Member(next_id[0], names(next_id[0]), gender)
+        next_id[0] += 1
+        return tree.add_member(member)
+
+    def marry(member):
+        spouse = new_member("Female" if member.gender.value == "Male" else "Male")
+        member.set_spouse(spouse)
+        spouse.set_spouse(member)
+        if member.gender.value == "Female":
+            return member, spouse
+        return spouse, member
+
+    couples = deque([marry(new_member("Male"))])
+    while couples and len(tree) < size:
+        mother, father = couples.popleft()
+        child = None
+        for _ in range(children_per_couple):
+            if len(tree) >= size:
+                break
+            child = new_member(rng.choice(("Male", "Female")))
+            child.set_mother(mother)
+            child.set_father(father)
+            mother.add_child(child)
+            father.add_child(child)
+            if len(tree) < size and rng.random() < marriage_rate:
+                couples.append(marry(child))
+        # keep the family going until the tree reaches its size
+        if not couples and child is not None and len(tree) < size:
+            couples.append(marry(child))
+    return tree
+
+
+def wide_tree(size, seed=0):
+    return build_tree(size, children_per_couple=40, marriage_rate=0.2, seed=seed)
+
+
+def deep_tree(size, seed=0):
+    # about one married child per couple, so generations stack up
+    return build_tree(size, children_per_couple=2, marriage_rate=0.5, seed=seed)
+
+
+def married_tree(size, seed=0):
+    return build_tree(size, children_per_couple=3, marriage_rate=1.0, seed=seed)
+
+
+def name_collision_tree(size, seed=0):
+    return build_tree(size, children_per_couple=3, marriage_rate=0.8, names=colliding_names,
+                      seed=seed)
+
+
+SHAPES = {
+    "wide": wide_tree,
+    "deep": deep_tree,
+    "married": married_tree,
+    "name_collision": name_collision_tree,
+}
@@ -0,0 +1,124 @@
+import argparse
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.generators import SHAPES
+from family_tree.member import RELATIONSHIP_TYPES
+from family_tree.snapshot import open_snapshot, save_snapshot
+from family_tree.store import ArrayStore
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def query_members(members, relationship_type):
+    return [x.get_relationship(relationship_type) for x in members]
+
+
+def query_tree(tree, member_ids, relationship_type):
+    return [tree.get_relationship(x, relationship_type) for x in member_ids]
+
+
+def measure_memory(build, size):
+    # traced on a separate build, since tracing slows construction down
+    gc.collect()
+    tracemalloc.start()
+    tree = build(size)
+    tree_bytes = tracemalloc.get_traced_memory()[0]
+    store = ArrayStore.from_tree(tree)
+    store_bytes = tracemalloc.get_traced_memory()[0] - tree_bytes
+    tracemalloc.stop()
+    del store, tree
+    return {"member_bytes": tree_bytes / size, "store_member_bytes": store_bytes / size}
+
+
+def run_case(shape, size, queries, memory, seed):
+    build = SHAPES[shape]
+    tree, build_seconds = timed(build, size, seed)
+    result = {"shape": shape, "size": len(tree), "build_seconds": build_seconds}
+
+    rng = random.Random(seed)
+    member_ids = list(tree.members)
+    sample = [rng.choice(member_ids) for _ in range(queries)]
+    members = [tree.get_member(member_id) for member_id in sample]
+
+    relationships = {}
+    for relationship_type in sorted(RELATIONSHIP_TYPES):
+        _, direct = timed(query_members, members, relationship_type)
+        tree.cache.clear()
+        _, cold = timed(query_tree, tree, sample, relationship_type)
+        _, warm = timed(query_tree, tree, sample, relationship_type)
+        _, batch = timed(tree.get_relationships, sample, relationship_type)
+        relationships[relationship_type] = {
+            "member_seconds": direct,
+            "tree_cold_seconds": cold,
+            "tree_warm_seconds": warm,
+            "batch_seconds": batch,
+        }
+    result["queries"] = queries
+    result["relationships"] = relationships
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.snapshot")
+        _, result["snapshot_save_seconds"] = timed(save_snapshot, tree, path)
+        result["snapshot_bytes"] = os.path.getsize(path)
+        snapshot, result["snapshot_open_seconds"] = timed(open_snapshot, path)
+        _, result["snapshot_query_seconds"] = timed(
+            snapshot.store.relatives_many,
+            [snapshot.store.index_of(x) for x in sample], "siblings")
+        snapshot.close()
+
+    del tree, members
+    if memory:
+        result.update(measure_memory(lambda n: build(n, seed), size))
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"],
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark tree construction and queries")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000],
+                        help="tree sizes, e.g. 1000 100000 10000000")
+    parser.add_argument("--shapes", nargs="+", default=sorted(SHAPES), choices=sorted(SHAPES))
+    parser.add_argument("--queries", type=int, default=1000,
+                        help="members queried per relationship")
+    parser.add_argument("--memory", action="store_true",
+                        help="also measure memory per member (slow on large trees)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    arguments = parser.parse_args(argv)
+
+    results = {
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "cases": [run_case(shape, size, arguments.queries, arguments.memory, arguments.seed)
+                  for size in arguments.sizes for shape in arguments.shapes],
+    }
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import sys
+
+from family_tree.cli import main
+
+sys.exit(main())
@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+
+
+class RelationshipCache:
+    # bounded LRU of relationship results; every entry remembers the ids of
+    # the members it was computed from so a mutation only drops what it affects
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.dependents = {}
+        self.hits = 0
+        self.misses = 0
+        # lookups reorder the LRU, so even concurrent readers need the lock
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, dependencies):
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._discard(key)
+            self.entries[key] = (value, dependencies)
+            for member_id in dependencies:
+                self.dependents.setdefault(member_id, set()).add(key)
+            while len(self.entries) > self.maxsize:
+                self._discard(next(iter(self.entries)))
+
+    def invalidate(self, member_id):
+        with self.lock:
+            for key in self.dependents.pop(member_id, ()):
+                self._discard(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.dependents.clear()
+
+    def _discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for member_id in entry[1]:
+            keys = self.dependents.get(member_id, None)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.dependents[member_id]
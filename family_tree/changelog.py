@@ -0,0 +1,124 @@
+import json
+from collections import namedtuple
+
+from family_tree.member import Member
+
+Change = namedtuple("Change", ["operation", "member_id", "other_id", "name", "gender"],
+                    defaults=(None, None, None))
+
+LINKS = {"set_mother": "mother", "set_father": "father", "set_spouse": "spouse"}
+
+
+def to_change(member, operation, other):
+    if operation == "add_member":
+        return Change(operation, member.id, None, member.name, member.gender.value)
+    return Change(operation, member.id, other.id if other is not None else None)
+
+
+class ChangeLog:
+    # append-only record of every change made to a tree after attach(); the
+    # version is the number of changes, so a delta is changes_since(version)
+    def __init__(self, changes=()):
+        self.changes = list(changes)
+        self.tree = None
+
+    def __len__(self):
+        return len(self.changes)
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    @property
+    def version(self):
+        return len(self.changes)
+
+    def attach(self, tree):
+        self.tree = tree
+        tree.listeners.append(self.record)
+        return self
+
+    def detach(self):
+        self.tree.listeners.remove(self.record)
+        self.tree = None
+
+    def record(self, member, operation, other):
+        self.changes.append(to_change(member, operation, other))
+
+    def changes_since(self, version):
+        return self.changes[version:]
+
+    def write(self, path, since=0):
+        with open(path, "a") as log_file:
+            for change in self.changes[since:]:
+                log_file.write(json.dumps(change._asdict()) + "\n")
+
+    @classmethod
+    def read(cls, path):
+        with open(path) as log_file:
+            return cls(Change(**json.loads(line)) for line in log_file if line.strip())
+
+
+def apply_changes(tree, changes):
+    # replays changes through the regular tree/member methods, so caches and
+    # indexes of the tree are updated member by member
+    members = tree.members
+    for change in changes:
+        operation = change.operation
+        if operation == "add_member":
+            tree.add_member(Member(change.member_id, change.name, change.gender))
+            continue
+        if operation == "remove_member":
+            tree.remove_member(change.member_id)
+            continue
+
+        member = members[change.member_id]
+        other = members[change.other_id] if change.other_id is not None else None
+        if operation == "add_child":
+            if member.children and member.children[-1] is other:
+                # already listed through a children list shared with the spouse
+                member._changed(operation, other)
+            else:
+                member.add_child(other)
+        elif operation == "remove_child":
+            # may already be gone through a children list shared with the spouse
+            if other in member.children:
+                member.children.remove(other)
+            member._changed(operation, other)
+        elif other is None:
+            setattr(member, LINKS[operation], None)
+            member._changed(operation, None)
+        else:
+            getattr(member, operation)(other)
+    return tree
+
+
+def diff(old_tree, new_tree):
+    # changes that turn old_tree into new_tree
+    changes = []
+    for member in new_tree:
+        if member.id not in old_tree:
+            changes.append(to_change(member, "add_member", None))
+
+    for member in new_tree:
+        old = old_tree.get_member(member.id)
+        for operation, attribute in LINKS.items():
+            relative = getattr(member, attribute)
+            old_relative = getattr(old, attribute) if old is not None else None
+            relative_id = relative.id if relative is not None else None
+            old_relative_id = old_relative.id if old_relative is not None else None
+            if relative_id != old_relative_id:
+                changes.append(Change(operation, member.id, relative_id))
+
+        old_children = [x.id for x in old.children] if old is not None else []
+        children = [x.id for x in member.children]
+        if children[:len(old_children)] == old_children:
+            removed, added = [], children[len(old_children):]
+        else:
+            removed, added = old_children, children
+        changes.extend(Change("remove_child", member.id, x) for x in reversed(removed))
+        changes.extend(Change("add_child", member.id, x) for x in added)
+
+    for member in old_tree:
+        if member.id not in new_tree:
+            changes.append(Change("remove_member", member.id))
+    return changes
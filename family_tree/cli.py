@@ -0,0 +1,86 @@
+import argparse
+import sys
+
+from family_tree.loader import load_tree
+from family_tree.member import Member, Gender
+from family_tree.tree import FamilyTree
+
+CHILD_ADDED = "CHILD_ADDED"
+CHILD_ADDITION_FAILED = "CHILD_ADDITION_FAILED"
+PERSON_NOT_FOUND = "PERSON_NOT_FOUND"
+INVALID_COMMAND = "INVALID_COMMAND"
+NONE = "NONE"
+
+OUTPUT_BATCH_SIZE = 4096
+
+
+class CommandProcessor:
+    def __init__(self, tree):
+        self.tree = tree
+        self.next_id = max(tree.members, default=0) + 1
+        # command -> (handler, number of arguments)
+        self.commands = {
+            "ADD_CHILD": (self.add_child, 3),
+            "GET_RELATIONSHIP": (self.get_relationship, 2),
+        }
+
+    def add_child(self, mother_name, child_name, gender):
+        mother = self.tree.get_member_by_name(mother_name)
+        if not mother:
+            return PERSON_NOT_FOUND
+        if mother.gender != Gender.female:
+            return CHILD_ADDITION_FAILED
+        try:
+            child = Member(self.next_id, child_name, gender)
+        except ValueError:
+            return CHILD_ADDITION_FAILED
+
+        self.tree.add_member(child)
+        self.next_id += 1
+        self.tree.link_child(mother, mother.spouse, child)
+        return CHILD_ADDED
+
+    def get_relationship(self, name, relationship):
+        member = self.tree.get_member_by_name(name)
+        if not member:
+            return PERSON_NOT_FOUND
+        relatives = self.tree.get_relationship(member.id, relationship.lower().replace("-", "_"))
+        if not relatives:
+            return NONE
+        return " ".join(x.name for x in relatives)
+
+    def execute(self, line):
+        arguments = line.split()
+        if not arguments:
+            return None
+        command = self.commands.get(arguments[0], None)
+        if not command or len(arguments) - 1 != command[1]:
+            return INVALID_COMMAND
+        return command[0](*arguments[1:])
+
+    def run(self, lines, output):
+        # results are written in batches rather than one write per command
+        batch = []
+        for line in lines:
+            result = self.execute(line)
+            if result is None:
+                continue
+            batch.append(result + "\n")
+            if len(batch) >= OUTPUT_BATCH_SIZE:
+                output.writelines(batch)
+                batch = []
+        output.writelines(batch)
+        output.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="family_tree",
+                                     description="Run a Meet the Family command file")
+    parser.add_argument("commands", help="file with ADD_CHILD / GET_RELATIONSHIP commands")
+    parser.add_argument("--tree", help="CSV or JSONL file with the initial family tree")
+    arguments = parser.parse_args(argv)
+
+    tree = load_tree(arguments.tree) if arguments.tree else FamilyTree()
+    with open(arguments.commands) as commands:
+        CommandProcessor(tree).run(commands, sys.stdout)
+    return 0
@@ -0,0 +1,112 @@
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    # many readers or a single writer; a waiting writer holds back new readers
+    # so a steady stream of queries cannot starve it. Reentrant per thread: a
+    # reader may read again and a writer may read or write again, but a reader
+    # asking to write raises, as waiting for the other readers could deadlock
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        # thread ident -> number of read holds
+        self._readers = {}
+        self._writer = None
+        self._writes = 0
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer != me and me not in self._readers:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers[me] = self._readers.get(me, 0) + 1
+
+    def release_read(self):
+        me = threading.get_ident()
+        with self._condition:
+            self._readers[me] -= 1
+            if not self._readers[me]:
+                del self._readers[me]
+                if not self._readers:
+                    self._condition.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writes += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("Cannot take the write lock while holding the read lock")
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = me
+            self._writes = 1
+
+    def release_write(self):
+        with self._condition:
+            self._writes -= 1
+            if not self._writes:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ThreadSafeFamilyTree:
+    # readers query concurrently; a writer gets the tree to itself for a whole
+    # batch of changes, so readers never see a half-linked family. Members
+    # handed out keep pointing into the live tree, so read their links inside
+    # read() when a consistent view matters. The methods below may be called
+    # inside read() or write(), except for add_member inside read().
+    def __init__(self, tree):
+        self.tree = tree
+        self.lock = ReadWriteLock()
+
+    @contextmanager
+    def read(self):
+        with self.lock.read_locked():
+            yield self.tree
+
+    @contextmanager
+    def write(self):
+        with self.lock.write_locked():
+            yield self.tree
+
+    def __len__(self):
+        with self.lock.read_locked():
+            return len(self.tree)
+
+    def get_member(self, member_id):
+        with self.lock.read_locked():
+            return self.tree.get_member(member_id)
+
+    def get_relationship(self, member_id, relationship_type):
+        with self.lock.read_locked():
+            return self.tree.get_relationship(member_id, relationship_type)
+
+    def get_relationships(self, member_ids, relationship_type):
+        with self.lock.read_locked():
+            return self.tree.get_relationships(member_ids, relationship_type)
+
+    def add_member(self, member):
+        with self.lock.write_locked():
+            return self.tree.add_member(member)
@@ -0,0 +1,91 @@
+import logging
+from collections import Counter
+
+logger = logging.getLogger("family_tree.slow_queries")
+
+
+class QueryHook:
+    # base for FamilyTree.add_hook; a tree without hooks skips timing entirely
+    def on_query(self, member_id, relationship_type, seconds, result, cached):
+        pass
+
+    def on_batch_query(self, relationship_type, size, seconds):
+        pass
+
+    def on_mutation(self, member, operation, other):
+        pass
+
+
+class QueryStats(QueryHook):
+    # per relationship: calls, cache hits and a latency histogram whose bucket
+    # n counts queries that took under 2 ** n microseconds; batches, whose
+    # time covers many members, get histograms of their own
+    BUCKETS = 24
+
+    def __init__(self):
+        self.queries = Counter()
+        self.cache_hits = Counter()
+        self.batch_queries = Counter()
+        self.batch_members = Counter()
+        self.mutations = Counter()
+        self.histograms = {}
+        self.batch_histograms = {}
+
+    def on_query(self, member_id, relationship_type, seconds, result, cached):
+        self.queries[relationship_type] += 1
+        if cached:
+            self.cache_hits[relationship_type] += 1
+        self._observe(self.histograms, relationship_type, seconds)
+
+    def on_batch_query(self, relationship_type, size, seconds):
+        self.batch_queries[relationship_type] += 1
+        self.batch_members[relationship_type] += size
+        self._observe(self.batch_histograms, relationship_type, seconds)
+
+    def on_mutation(self, member, operation, other):
+        self.mutations[operation] += 1
+
+    def _observe(self, histograms, relationship_type, seconds):
+        histogram = histograms.get(relationship_type, None)
+        if histogram is None:
+            histogram = histograms[relationship_type] = [0] * self.BUCKETS
+        bucket = min(int(seconds * 1000000).bit_length(), self.BUCKETS - 1)
+        histogram[bucket] += 1
+
+    def cache_hit_rate(self, relationship_type=None):
+        if relationship_type is None:
+            queries = sum(self.queries.values())
+            hits = sum(self.cache_hits.values())
+        else:
+            queries = self.queries[relationship_type]
+            hits = self.cache_hits[relationship_type]
+        if not queries:
+            return 0.0
+        return hits / queries
+
+    def summary(self):
+        return {
+            "queries": dict(self.queries),
+            "cache_hit_rate": {x: self.cache_hit_rate(x) for x in self.queries},
+            "batch_queries": dict(self.batch_queries),
+            "batch_members": dict(self.batch_members),
+            "mutations": dict(self.mutations),
+            "latency_histograms": {x: list(y) for x, y in self.histograms.items()},
+            "batch_latency_histograms": {x: list(y) for x, y in self.batch_histograms.items()},
+        }
+
+
+class SlowQueryLog(QueryHook):
+    def __init__(self, threshold=0.01, log=logger):
+        self.threshold = threshold
+        self.log = log
+
+    def on_query(self, member_id, relationship_type, seconds, result, cached):
+        if seconds >= self.threshold:
+            self.log.warning("Slow %s query for member %s: %.6fs", relationship_type,
+                             member_id, seconds)
+
+    def on_batch_query(self, relationship_type, size, seconds):
+        if seconds >= self.threshold:
+            self.log.warning("Slow %s batch query for %d members: %.6fs", relationship_type,
+                             size, seconds)
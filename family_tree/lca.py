@@ -0,0 +1,186 @@
+from family_tree.traversal import describe_relationship, find_common_ancestor, get_parents
+
+
+class LineageIndex:
+    # binary lifting over a single parent link: every member has at most one
+    # mother (or father), so each lineage is a forest and the lowest common
+    # ancestor of two members is found in O(log n) jumps
+    def __init__(self, parent_attribute):
+        self.parent_attribute = parent_attribute
+        self.depth = {}
+        self.up = {}
+
+    def __len__(self):
+        return len(self.depth)
+
+    def __contains__(self, member_id):
+        return member_id in self.depth
+
+    def build(self, members):
+        for member in members:
+            chain = []
+            on_chain = set()
+            current = member
+            while current is not None and current.id not in self.depth:
+                if current.id in on_chain:
+                    raise ValueError("{} is their own ancestor through {} links".format(
+                        current.id, self.parent_attribute))
+                chain.append(current)
+                on_chain.add(current.id)
+                current = getattr(current, self.parent_attribute)
+            for ancestor in reversed(chain):
+                self.add(ancestor)
+        return self
+
+    def add(self, member):
+        # meant for new leaves: the parent has to be indexed already
+        parent = getattr(member, self.parent_attribute)
+        if parent is None:
+            self.depth[member.id] = 0
+            self.up[member.id] = []
+            return
+        if parent.id not in self.depth:
+            raise ValueError("Parent of {} is not indexed".format(member.id))
+
+        up = [parent.id]
+        while len(self.up[up[-1]]) >= len(up):
+            up.append(self.up[up[-1]][len(up) - 1])
+        self.depth[member.id] = self.depth[parent.id] + 1
+        self.up[member.id] = up
+
+    def lift(self, member_id, generations):
+        bit = 0
+        while generations:
+            if generations & 1:
+                member_id = self.up[member_id][bit]
+            generations >>= 1
+            bit += 1
+        return member_id
+
+    def lca(self, member_a_id, member_b_id):
+        if member_a_id not in self.depth or member_b_id not in self.depth:
+            return None
+        if self.depth[member_a_id] < self.depth[member_b_id]:
+            member_a_id, member_b_id = member_b_id, member_a_id
+        member_a_id = self.lift(member_a_id, self.depth[member_a_id] - self.depth[member_b_id])
+        if member_a_id == member_b_id:
+            return member_a_id
+
+        for bit in reversed(range(len(self.up[member_a_id]))):
+            up_a = self.up[member_a_id]
+            up_b = self.up[member_b_id]
+            if bit < len(up_a) and up_a[bit] != up_b[bit]:
+                member_a_id, member_b_id = up_a[bit], up_b[bit]
+
+        up_a = self.up[member_a_id]
+        if up_a and up_a[0] == self.up[member_b_id][0]:
+            return up_a[0]
+        return None
+
+
+class KinshipIndex:
+    # LCA over the maternal and the paternal lineages. A single lineage only
+    # sees ancestors along mothers only or fathers only, so its answer is an
+    # upper bound: a closer ancestor through mixed links (a mother's father)
+    # is looked for with the traversal engine, limited to that bound. Members
+    # of different families (no chain of parent links between them) are
+    # answered in O(1); blood relatives in the same family whose closest
+    # ancestor is on mixed links still cost a bounded traversal.
+    # The index follows the tree as a listener: a new member, or a parent set
+    # on a member without children, is added in O(log n); any other change of
+    # parents or a removal rebuilds the index on the next query
+    def __init__(self, tree):
+        self.tree = tree
+        self.stale = True
+        self._build()
+        tree.listeners.append(self.member_changed)
+
+    def detach(self):
+        self.tree.listeners.remove(self.member_changed)
+
+    def _build(self):
+        self.maternal = LineageIndex("mother").build(self.tree)
+        self.paternal = LineageIndex("father").build(self.tree)
+        self.families = {}
+        for member in self.tree:
+            self._join(member)
+        self.stale = False
+
+    def member_changed(self, member, operation, other):
+        if self.stale or operation not in ("add_member", "set_mother", "set_father",
+                                           "remove_member"):
+            return
+        if operation == "remove_member" or member.children:
+            self.stale = True
+            return
+        try:
+            self.add(member)
+        except ValueError:
+            self.stale = True
+
+    def add(self, member):
+        self.maternal.add(member)
+        self.paternal.add(member)
+        self._join(member)
+
+    def _check(self, *members):
+        if self.stale:
+            self._build()
+        for member in members:
+            if member.id not in self.maternal:
+                raise ValueError("Member {} is not indexed".format(member.id))
+
+    def _family(self, member_id):
+        families = self.families
+        families.setdefault(member_id, member_id)
+        while families[member_id] != member_id:
+            families[member_id] = families[families[member_id]]
+            member_id = families[member_id]
+        return member_id
+
+    def _join(self, member):
+        # union-find over parent links: blood relatives share a family
+        family = self._family(member.id)
+        for parent in get_parents(member):
+            other = self._family(parent.id)
+            if other != family:
+                self.families[other] = family
+
+    def find_common_ancestor(self, member_a, member_b):
+        self._check(member_a, member_b)
+        if self._family(member_a.id) != self._family(member_b.id):
+            return None
+        best = None
+        for lineage in (self.maternal, self.paternal):
+            ancestor_id = lineage.lca(member_a.id, member_b.id)
+            if ancestor_id is None:
+                continue
+            up = lineage.depth[member_a.id] - lineage.depth[ancestor_id]
+            down = lineage.depth[member_b.id] - lineage.depth[ancestor_id]
+            if best is None or up + down < best[1] + best[2]:
+                best = (self.tree.get_member(ancestor_id), up, down)
+        if best is None:
+            return find_common_ancestor(member_a, member_b)
+        if best[1] + best[2] == 0:
+            return best
+        # anything closer lies fewer than up + down generations away on both sides
+        closer = find_common_ancestor(member_a, member_b, best[1] + best[2] - 1)
+        if closer is not None and closer[1] + closer[2] < best[1] + best[2]:
+            return closer
+        return best
+
+    def are_blood_relatives(self, member_a, member_b):
+        self._check(member_a, member_b)
+        if self._family(member_a.id) != self._family(member_b.id):
+            return False
+        if self.maternal.lca(member_a.id, member_b.id) is not None:
+            return True
+        if self.paternal.lca(member_a.id, member_b.id) is not None:
+            return True
+        return find_common_ancestor(member_a, member_b) is not None
+
+    def get_relation(self, member_a, member_b):
+        common = self.find_common_ancestor(member_a, member_b)
+        if common is None:
+            return None
+        return describe_relationship(common[1], common[2])
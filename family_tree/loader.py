@@ -0,0 +1,154 @@
+import csv
+import json
+
+from family_tree.member import Member, Gender
+from family_tree.tree import FamilyTree
+
+
+def _parse_id(value):
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def _check_link(member, role, relative):
+    if role == "mother":
+        if relative.gender != Gender.female:
+            return "Mother of {} should be a female!".format(member.id)
+    elif role == "father":
+        if relative.gender != Gender.male:
+            return "Father of {} should be a male!".format(member.id)
+    else:
+        if relative.gender == member.gender:
+            return "Invalid gender for spouse of {}".format(member.id)
+        if ((member.spouse is not None and member.spouse is not relative)
+                or (relative.spouse is not None and relative.spouse is not member)):
+            return "Spouse of {} is married to someone else".format(member.id)
+    return None
+
+
+def _link(member, role, relative, errors, applied):
+    error = _check_link(member, role, relative)
+    if error is not None:
+        errors.append(error)
+        return
+    applied.append((member, role, relative))
+    if role in ("mother", "father"):
+        setattr(member, role, relative)
+        # a couple sharing their children list lists the child once
+        if not relative.children or relative.children[-1] is not member:
+            relative.children.append(member)
+    else:
+        member.spouse = relative
+        relative.spouse = member
+
+
+def _notify(member, role, relative):
+    # reports a link made by the loader as the member setters would have
+    if role == "spouse":
+        member._changed("set_spouse", relative)
+        relative._changed("set_spouse", member)
+    else:
+        member._changed("set_" + role, relative)
+        relative._changed("add_child", member)
+
+
+def _read_member(record, errors):
+    try:
+        return Member(_parse_id(record["id"]), record["name"], record["gender"])
+    except (KeyError, TypeError, ValueError) as error:
+        errors.append("Invalid record {}: {}".format(record, error))
+        return None
+
+
+def load_records(records, tree=None):
+    # single pass over members kept apart from the tree: links to members not
+    # read yet are parked until they show up, links to members already in the
+    # tree wait until the end, and all errors are reported together before
+    # the tree is touched
+    if tree is None:
+        tree = FamilyTree()
+    existing = tree.members
+    members = {}
+    pending = {}
+    links = []
+    applied = []
+    errors = []
+
+    for record in records:
+        member = _read_member(record, errors)
+        if member is None:
+            continue
+        if member.id is None or member.id in members or member.id in existing:
+            errors.append("Member with id {} already exists".format(member.id))
+            continue
+        members[member.id] = member
+
+        for role, waiting in pending.pop(member.id, ()):
+            _link(waiting, role, member, errors, applied)
+
+        for role in ("mother", "father", "spouse"):
+            try:
+                relative_id = _parse_id(record.get(role + "_id"))
+            except ValueError:
+                errors.append("Invalid {} id for {}".format(role, member.id))
+                continue
+            if relative_id is None:
+                continue
+            relative = members.get(relative_id, None)
+            if relative is None and relative_id in existing:
+                links.append((member, role, existing[relative_id]))
+            elif relative is None:
+                pending.setdefault(relative_id, []).append((role, member))
+            elif role != "spouse" or relative.spouse is not member:
+                _link(member, role, relative, errors, applied)
+
+    for relative_id in pending:
+        errors.append("Unknown member id {}".format(relative_id))
+    # links into the tree are checked together, two new members included
+    married = {}
+    for member, role, relative in links:
+        error = _check_link(member, role, relative)
+        if error is None and role == "spouse":
+            if married.setdefault(relative.id, member) is not member:
+                error = "Spouse of {} is married to someone else".format(member.id)
+        if error is not None:
+            errors.append(error)
+    if errors:
+        raise ValueError("Invalid tree data: " + "; ".join(errors))
+
+    for member, role, relative in links:
+        _link(member, role, relative, errors, applied)
+    for member in members.values():
+        tree.add_member(member)
+    # links were made directly, so listeners and caches hear of them now
+    for member, role, relative in applied:
+        _notify(member, role, relative)
+    return tree
+
+
+def iter_csv(path):
+    with open(path, newline="") as csv_file:
+        for row in csv.DictReader(csv_file):
+            yield row
+
+
+def iter_jsonl(path):
+    with open(path) as jsonl_file:
+        for line in jsonl_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_csv(path, tree=None):
+    return load_records(iter_csv(path), tree)
+
+
+def load_jsonl(path, tree=None):
+    return load_records(iter_jsonl(path), tree)
+
+
+def load_tree(path, tree=None):
+    if str(path).endswith(".jsonl"):
+        return load_jsonl(path, tree)
+    return load_csv(path, tree)
@@ -0,0 +1,77 @@
+import csv
+import os
+from array import array
+
+from family_tree.member import Relationship, relationship_name
+from family_tree.store import ArrayStore, NO_MEMBER
+
+HEADER = ("member_id", "relationship", "relative_id")
+
+
+def iter_generations(store):
+    # lists of member indexes, founders first and then everyone whose parents
+    # are all in earlier generations; members that never get there (a parent
+    # not listing them, or a cycle) come last as one group
+    mothers = store.mothers
+    fathers = store.fathers
+    pending = array("i", ((mothers[index] != NO_MEMBER) + (fathers[index] != NO_MEMBER)
+                          for index in range(len(store))))
+    generation = [index for index in range(len(store)) if not pending[index]]
+    seen = len(generation)
+    while generation:
+        yield generation
+        following = []
+        for parent in generation:
+            for child in store.children(parent):
+                if mothers[child] != parent and fathers[child] != parent:
+                    continue
+                pending[child] -= 1
+                if not pending[child]:
+                    following.append(child)
+        generation = following
+        seen += len(generation)
+    if seen < len(store):
+        yield [index for index in range(len(store)) if pending[index] > 0]
+
+
+def iter_edges(tree, relationship_types=None):
+    # every (member_id, relationship, relative_id) of the tree; one batch per
+    # generation, so siblings and cousins share their anchor's filtered children
+    store = tree if isinstance(tree, ArrayStore) else ArrayStore.from_tree(tree)
+    if relationship_types is None:
+        relationship_types = list(Relationship)
+    names = [relationship_name(x, strict=True) for x in relationship_types]
+    ids = store.ids
+    for generation in iter_generations(store):
+        for name in names:
+            for index, relatives in zip(generation, store.relatives_many(generation, name)):
+                member_id = ids[index]
+                for relative in relatives:
+                    yield member_id, name, ids[relative]
+
+
+def write_edges(tree, directory, chunk_size=100000, relationship_types=None):
+    # streams the edge table into part-00000.csv, part-00001.csv, ... with at
+    # most chunk_size rows each; returns the paths written
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    part_file = None
+    writer = None
+    rows = 0
+    try:
+        for edge in iter_edges(tree, relationship_types):
+            if writer is None or rows == chunk_size:
+                if part_file is not None:
+                    part_file.close()
+                path = os.path.join(directory, "part-{:05d}.csv".format(len(paths)))
+                part_file = open(path, "w", newline="")
+                writer = csv.writer(part_file)
+                writer.writerow(HEADER)
+                paths.append(path)
+                rows = 0
+            writer.writerow(edge)
+            rows += 1
+    finally:
+        if part_file is not None:
+            part_file.close()
+    return paths
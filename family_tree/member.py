@@ -1,4 +1,5 @@
-from enum import Enum
+import sys
+from enum import Enum, IntEnum
 
 
 class Gender(Enum):
@@ -6,15 +7,158 @@ class Gender(Enum):
     female = "Female"
 
 
+class Relationship(IntEnum):
+    paternal_aunt = 1
+    paternal_uncle = 2
+    maternal_aunt = 3
+    maternal_uncle = 4
+    brother_in_law = 5
+    sister_in_law = 6
+    son = 7
+    daughter = 8
+    siblings = 9
+
+
+RELATIONSHIP_TYPES = frozenset(x.name for x in Relationship)
+
+# relationship (enum member or its name) -> name, shared by every lookup
+RELATIONSHIP_NAMES = dict([(x, x.name) for x in Relationship] +
+                          [(x.name, x.name) for x in Relationship])
+
+
+def relationship_name(relationship_type, strict=False):
+    name = RELATIONSHIP_NAMES.get(relationship_type, None)
+    if name is None and strict:
+        raise ValueError("Unknown relationship {!r}".format(relationship_type))
+    return name
+
+
+class Children(list):
+    # children list that keeps the same children partitioned by gender, so
+    # son/daughter/aunt/uncle lookups read a partition instead of filtering;
+    # the partitions are built on first use, members never asked about their
+    # children only pay for two empty slots
+    __slots__ = ("_males", "_females")
+
+    def __init__(self, children=()):
+        super().__init__(children)
+        self._males = None
+        self._females = None
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles rebuild the partitions from the children
+        return Children, (list(self),)
+
+    def _invalidate(self):
+        self._males = None
+        self._females = None
+
+    @property
+    def males(self):
+        if self._males is None:
+            self._partition()
+        return self._males
+
+    @property
+    def females(self):
+        if self._females is None:
+            self._partition()
+        return self._females
+
+    def _partition(self):
+        self._males = [x for x in self if x.gender == Gender.male]
+        self._females = [x for x in self if x.gender == Gender.female]
+
+    def of_gender(self, gender):
+        if gender == Gender.male:
+            return self.males
+        return self.females
+
+    def append(self, child):
+        super().append(child)
+        if self._males is not None:
+            self.of_gender(child.gender).append(child)
+
+    def extend(self, children):
+        for child in children:
+            self.append(child)
+
+    def __iadd__(self, children):
+        self.extend(children)
+        return self
+
+    # anything that reorders or drops children drops the partitions
+
+    def insert(self, index, child):
+        super().insert(index, child)
+        self._invalidate()
+
+    def remove(self, child):
+        super().remove(child)
+        self._invalidate()
+
+    def pop(self, index=-1):
+        child = super().pop(index)
+        self._invalidate()
+        return child
+
+    def clear(self):
+        super().clear()
+        self._invalidate()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._invalidate()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._invalidate()
+
+
 class Member:
+    __slots__ = ("id", "name", "gender", "mother", "father", "spouse", "children", "tree")
+
+    # static dispatch tables: relationship (enum member or name) -> method name
+    GET_METHODS = {key: "get_" + name for key, name in RELATIONSHIP_NAMES.items()}
+    ITER_METHODS = {key: "iter_" + name for key, name in RELATIONSHIP_NAMES.items()}
+
     def __init__(self, id, name, gender):
         self.id = id
-        self.name = name
+        # members sharing a name share one string
+        self.name = sys.intern(name) if isinstance(name, str) else name
         self.gender = Gender(gender)
         self.mother = None
         self.father = None
         self.spouse = None
-        self.children = []
+        self.children = Children()
+        self.tree = None
+
+    def _changed(self, operation, other):
+        # lets the tree holding this member drop cached results that depend on it
+        if self.tree is not None:
+            self.tree.member_changed(self, operation, other)
+
+    def _unshare_children(self):
+        # gives the member a children list of their own when it is shared with
+        # the spouse, so a list is only ever shared by a married couple
+        spouse = self.spouse
+        if spouse is not None and spouse.children is self.children:
+            self.children = Children(self.children)
+
+    def _children_changed(self, operation, child):
+        self._changed(operation, child)
+        # a spouse sharing this children list (see FamilyTree.marry) sees the change too
+        spouse = self.spouse
+        if spouse is not None and spouse.children is self.children:
+            spouse._changed(operation, child)
 
     def set_mother(self, mother):
         if not isinstance(mother, Member):
@@ -24,6 +168,7 @@ class Member:
             raise ValueError("Mother should be a female!")
 
         self.mother = mother
+        self._changed("set_mother", mother)
 
     def set_father(self, father):
         if not isinstance(father, Member):
@@ -32,6 +177,7 @@ class Member:
             raise ValueError("father should be a male!")
 
         self.father = father
+        self._changed("set_father", father)
 
     def set_spouse(self, spouse):
         if not isinstance(spouse, Member):
@@ -40,12 +186,23 @@ class Member:
         if self.gender == spouse.gender:
             raise ValueError("Invalid gender for spouse")
 
+        if spouse is not self.spouse:
+            self._unshare_children()
         self.spouse = spouse
+        self._changed("set_spouse", spouse)
 
     def add_child(self, child):
         if not isinstance(child, Member):
             raise ValueError('Invalid value for child')
         self.children.append(child)
+        self._children_changed("add_child", child)
+
+    @property
+    def sibling_group(self):
+        # siblings share their mother's children list, which identifies the group
+        if not self.mother:
+            return None
+        return self.mother.children
 
     def get_paternal_grandmother(self):
         if not self.father:
@@ -68,90 +225,129 @@ class Member:
             return None
         return self.spouse.mother
 
-    def get_paternal_aunt(self):
+    def iter_paternal_aunt(self):
         grandmother = self.get_paternal_grandmother()
         if not grandmother:
-            return []
+            return
         if not grandmother.children:
-            return []
-        return list(filter(lambda x: x.gender == Gender.female, grandmother.children))
+            return
+        yield from grandmother.children.females
 
-    def get_paternal_uncle(self):
+    def iter_paternal_uncle(self):
         grandmother = self.get_paternal_grandmother()
         if not grandmother:
-            return []
+            return
         if not grandmother.children:
-            return []
-        return list(filter(lambda x: x.gender == Gender.male and
-                                     x.name != self.father.name, grandmother.children))
+            return
+        yield from (x for x in grandmother.children.males if x.id != self.father.id)
 
-    def get_maternal_aunt(self):
+    def iter_maternal_aunt(self):
         grandmother = self.get_maternal_grandmother()
         if not grandmother:
-            return []
+            return
         if not grandmother.children:
-            return []
-        return list(filter(lambda x: x.gender == Gender.female and
-                                     x.name != self.mother.name, grandmother.children))
+            return
+        yield from (x for x in grandmother.children.females if x.id != self.mother.id)
 
-    def get_maternal_uncle(self):
+    def iter_maternal_uncle(self):
         grandmother = self.get_maternal_grandmother()
         if not grandmother:
-            return []
+            return
         if not grandmother.children:
-            return []
-        return list(filter(lambda x: x.gender == Gender.male, grandmother.children))
+            return
+        yield from grandmother.children.males
 
-    def get_brother_in_law(self):
+    def iter_brother_in_law(self):
         spouse_mother = self.get_spouse_mother()
         if not spouse_mother:
-            return []
+            return
         if not spouse_mother.children:
-            return []
-        return list(filter(lambda x: x.gender == Gender.male and x.name != self.spouse.name,
-                           spouse_mother.children))
+            return
+        yield from (x for x in spouse_mother.children.males if x.id != self.spouse.id)
 
-    def get_sister_in_law(self):
+    def iter_sister_in_law(self):
         spouse_mother = self.get_spouse_mother()
         if not spouse_mother:
-            return []
+            return
         if not spouse_mother.children:
-            return []
-        return list(filter(lambda x: x.gender == Gender.female and x.name != self.spouse.name,
-                           spouse_mother.children))
+            return
+        yield from (x for x in spouse_mother.children.females if x.id != self.spouse.id)
 
-    def get_son(self):
+    def iter_son(self):
         if not self.children:
-            return []
-        return list(filter(lambda x: x.gender == Gender.male, self.children))
+            return
+        yield from self.children.males
 
-    def get_daughter(self):
+    def iter_daughter(self):
         if not self.children:
-            return []
-        return list(filter(lambda x: x.gender == Gender.female, self.children))
+            return
+        yield from self.children.females
 
-    def get_siblings(self):
+    def iter_siblings(self):
         if not self.mother:
-            return []
+            return
         if not self.mother.children:
-            return []
-        return list(filter(lambda x: x.name != self.name, self.mother.children))
-
-    def get_relationship(self, relationship_type):
-        relationship_method_switch = {
-            "paternal_aunt": self.get_paternal_aunt,
-            "paternal_uncle": self.get_paternal_uncle,
-            "maternal_aunt": self.get_maternal_aunt,
-            "maternal_uncle": self.get_maternal_uncle,
-            "brother_in_law": self.get_brother_in_law,
-            "sister_in_law": self.get_sister_in_law,
-            "son": self.get_son,
-            "daughter": self.get_daughter,
-            "siblings": self.get_siblings,
-        }
-
-        relationship_method = relationship_method_switch.get(relationship_type, None)
-        if relationship_method:
-            return relationship_method()
-        else:
-            return []
+            return
+        yield from (x for x in self.sibling_group if x.id != self.id)
+
+    def get_paternal_aunt(self):
+        return list(self.iter_paternal_aunt())
+
+    def get_paternal_uncle(self):
+        return list(self.iter_paternal_uncle())
+
+    def get_maternal_aunt(self):
+        return list(self.iter_maternal_aunt())
+
+    def get_maternal_uncle(self):
+        return list(self.iter_maternal_uncle())
+
+    def get_brother_in_law(self):
+        return list(self.iter_brother_in_law())
+
+    def get_sister_in_law(self):
+        return list(self.iter_sister_in_law())
+
+    def get_son(self):
+        return list(self.iter_son())
+
+    def get_daughter(self):
+        return list(self.iter_daughter())
+
+    def get_siblings(self):
+        return list(self.iter_siblings())
+
+    def iter_relationship(self, relationship_type, strict=False):
+        method_name = self.ITER_METHODS.get(relationship_type, None)
+        if not method_name:
+            relationship_name(relationship_type, strict)
+            return iter(())
+        return getattr(self, method_name)()
+
+    def count_relationship(self, relationship_type):
+        return sum(1 for _ in self.iter_relationship(relationship_type))
+
+    def has_relationship(self, relationship_type):
+        return next(self.iter_relationship(relationship_type), None) is not None
+
+    def get_relationship(self, relationship_type, strict=False):
+        method_name = self.GET_METHODS.get(relationship_type, None)
+        if method_name:
+            return getattr(self, method_name)()
+        relationship_name(relationship_type, strict)
+        return []
+
+    def get_composed_relationship(self, relationship_types, strict=False):
+        # e.g. ("siblings", "son") for the sons of one's siblings; relatives
+        # reached more than once, and the member themselves, are listed once / left out
+        members = [self]
+        for relationship_type in relationship_types:
+            seen = {self.id}
+            relatives = []
+            for member in members:
+                for relative in member.iter_relationship(relationship_type, strict):
+                    if relative.id not in seen:
+                        seen.add(relative.id)
+                        relatives.append(relative)
+            members = relatives
+        return members
@@ -0,0 +1,113 @@
+from bisect import bisect_left, insort
+from heapq import merge
+
+
+def _starting_with(keys, prefix):
+    for index in range(bisect_left(keys, prefix), len(keys)):
+        if not keys[index].startswith(prefix):
+            break
+        yield keys[index]
+
+
+def _holds(keys, key):
+    index = bisect_left(keys, key)
+    return index < len(keys) and keys[index] == key
+
+
+class SortedKeys:
+    # sorted distinct strings with O(sqrt n) updates: new keys go to a small
+    # sorted buffer and removed ones to a set, and both are merged into the
+    # main list once they outgrow 8 * sqrt(n)
+    def __init__(self, keys=()):
+        self.keys = sorted(keys)
+        self.added = []
+        self.removed = set()
+
+    def __len__(self):
+        return len(self.keys) + len(self.added) - len(self.removed)
+
+    def __iter__(self):
+        return self.starting_with("")
+
+    def __contains__(self, key):
+        if key in self.removed:
+            return False
+        return _holds(self.keys, key) or _holds(self.added, key)
+
+    def add(self, key):
+        if key in self.removed:
+            self.removed.discard(key)
+            return
+        insort(self.added, key)
+        self._merge()
+
+    def discard(self, key):
+        index = bisect_left(self.added, key)
+        if index < len(self.added) and self.added[index] == key:
+            del self.added[index]
+        elif _holds(self.keys, key):
+            self.removed.add(key)
+            self._merge()
+
+    def _merge(self):
+        if (len(self.added) + len(self.removed)) ** 2 <= 64 * len(self.keys):
+            return
+        # two sorted runs, which sorted() merges in linear time
+        keys = sorted(self.keys + self.added)
+        if self.removed:
+            removed = self.removed
+            keys = [key for key in keys if key not in removed]
+        self.keys = keys
+        self.added = []
+        self.removed = set()
+
+    def starting_with(self, prefix):
+        removed = self.removed
+        return (key for key in merge(_starting_with(self.keys, prefix),
+                                     _starting_with(self.added, prefix))
+                if key not in removed)
+
+
+class NameIndex:
+    # distinct names of a tree, sorted for prefix search, plus the same names
+    # casefolded for case-insensitive search; kept up to date by the tree as
+    # distinct names come and go
+    def __init__(self, names):
+        self.names = SortedKeys(names)
+        self.folded = {}
+        for name in self.names:
+            self.folded.setdefault(name.casefold(), []).append(name)
+        self.folded_names = SortedKeys(self.folded)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name):
+        self.names.add(name)
+        folded = name.casefold()
+        names = self.folded.get(folded, None)
+        if names is None:
+            names = self.folded[folded] = []
+            self.folded_names.add(folded)
+        insort(names, name)
+
+    def discard(self, name):
+        if name not in self.names:
+            return
+        self.names.discard(name)
+        folded = name.casefold()
+        names = self.folded[folded]
+        names.remove(name)
+        if not names:
+            del self.folded[folded]
+            self.folded_names.discard(folded)
+
+    def iter_names(self, text, prefix=False, ignore_case=False):
+        # names equal to text or, with prefix, starting with it, in sorted order
+        if not ignore_case:
+            if prefix:
+                return self.names.starting_with(text)
+            return iter([text] if text in self.names else [])
+        text = text.casefold()
+        keys = self.folded_names.starting_with(text) if prefix else [text]
+        return (name for key in keys for name in self.folded.get(key, ()))
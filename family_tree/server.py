@@ -0,0 +1,64 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from family_tree.snapshot import dumps, loads
+from family_tree.store import ArrayStore, NO_MEMBER
+
+# the tree as seen by a worker process, attached once by _attach
+_worker_memory = None
+_worker_store = None
+
+
+def _attach(name):
+    global _worker_memory, _worker_store
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    _worker_store = loads(_worker_memory.buf)
+
+
+def _query(member_ids, relationship_type):
+    store = _worker_store
+    indexes = [store.index_of(member_id) for member_id in member_ids]
+    results = []
+    for index, relatives in zip(indexes, store.relatives_many(indexes, relationship_type)):
+        if index == NO_MEMBER:
+            results.append(None)
+        else:
+            results.append([store.ids[relative] for relative in relatives])
+    return results
+
+
+class QueryServer:
+    # one read-only copy of the tree in shared memory, in snapshot layout,
+    # queried by a pool of worker processes; results are lists of member ids
+    def __init__(self, tree, workers=None, chunk_size=1024):
+        store = tree if isinstance(tree, ArrayStore) else ArrayStore.from_tree(tree)
+        data = dumps(store)
+        self.chunk_size = chunk_size
+        self.memory = shared_memory.SharedMemory(create=True, size=len(data))
+        self.memory.buf[:len(data)] = data
+        self.pool = ProcessPoolExecutor(workers, initializer=_attach,
+                                        initargs=(self.memory.name,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_relationship(self, member_id, relationship_type):
+        return self.pool.submit(_query, [member_id], relationship_type).result()[0]
+
+    def get_relationships(self, member_ids, relationship_type):
+        member_ids = list(member_ids)
+        chunks = [member_ids[start:start + self.chunk_size]
+                  for start in range(0, len(member_ids), self.chunk_size)]
+        futures = [self.pool.submit(_query, chunk, relationship_type) for chunk in chunks]
+        results = {}
+        for chunk, future in zip(chunks, futures):
+            results.update(zip(chunk, future.result()))
+        return results
+
+    def close(self):
+        self.pool.shutdown()
+        self.memory.close()
+        self.memory.unlink()
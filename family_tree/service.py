@@ -0,0 +1,157 @@
+import asyncio
+import json
+
+
+class RelationshipService:
+    # JSON lines over TCP or a Unix socket: each request line is
+    # {"member_id": ..., "relationship": ...} and is answered, in order, with
+    # the same fields plus "relatives" (member ids, or null for unknown members).
+    # Requests arriving within batch_window seconds are answered together.
+    def __init__(self, tree, batch_window=0.001, max_batch_size=1024, max_pending=10000,
+                 max_in_flight=100, max_connections=1000):
+        self.tree = tree
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        self.max_in_flight = max_in_flight
+        self.max_connections = max_connections
+        self.queue = None
+        self.connections = None
+        self.batcher = None
+        self.server = None
+        # connection handler task -> its writer
+        self.handlers = {}
+
+    async def start(self, host="127.0.0.1", port=0):
+        self._prepare()
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server
+
+    async def start_unix(self, path):
+        self._prepare()
+        self.server = await asyncio.start_unix_server(self.handle_connection, path)
+        return self.server
+
+    async def close(self):
+        # closing the writers ends each connection at EOF, so the handlers
+        # return on their own while the batcher still answers what they wait on
+        if self.server is not None:
+            self.server.close()
+        for writer in list(self.handlers.values()):
+            writer.close()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+        if self.batcher is not None:
+            self.batcher.cancel()
+            try:
+                await self.batcher
+            except asyncio.CancelledError:
+                pass
+
+    def _prepare(self):
+        # the queue bounds pending requests: when it is full readers stop
+        # reading, which pushes back on the clients through the socket
+        self.queue = asyncio.Queue(self.max_pending)
+        self.connections = asyncio.Semaphore(self.max_connections)
+        self.batcher = asyncio.ensure_future(self._run_batches())
+
+    async def query(self, member_id, relationship_type):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((member_id, relationship_type, future))
+        return await future
+
+    async def _run_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._answer(batch)
+
+    def _answer(self, batch):
+        by_relationship = {}
+        for request in batch:
+            by_relationship.setdefault(request[1], []).append(request)
+        for relationship_type, requests in by_relationship.items():
+            try:
+                results = self.tree.get_relationships([x[0] for x in requests],
+                                                      relationship_type)
+            except Exception as error:
+                for _, _, future in requests:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            for member_id, _, future in requests:
+                if future.done():
+                    continue
+                relatives = results[member_id]
+                future.set_result(None if relatives is None else [x.id for x in relatives])
+
+    async def handle_connection(self, reader, writer):
+        handler = asyncio.current_task()
+        self.handlers[handler] = writer
+        async with self.connections:
+            in_flight = asyncio.Semaphore(self.max_in_flight)
+            responses = asyncio.Queue()
+            sender = asyncio.ensure_future(self._send(writer, responses, in_flight))
+            try:
+                while True:
+                    try:
+                        line = await reader.readline()
+                    except ConnectionError:
+                        break
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    await in_flight.acquire()
+                    await responses.put(asyncio.ensure_future(self._respond(line)))
+                await responses.put(None)
+                await sender
+            finally:
+                sender.cancel()
+                writer.close()
+                self.handlers.pop(handler, None)
+
+    async def _respond(self, line):
+        try:
+            request = json.loads(line)
+            member_id = request["member_id"]
+            relationship_type = request["relationship"]
+        except (ValueError, KeyError, TypeError):
+            return {"error": "Invalid request"}
+        if not isinstance(member_id, int) or not isinstance(relationship_type, str):
+            return {"error": "Invalid request"}
+        try:
+            relatives = await self.query(member_id, relationship_type)
+        except Exception as error:
+            # a failed batch answers each of its requests; the connection goes on
+            return {"error": "Query failed: {}".format(error)}
+        response = dict(request)
+        response["relatives"] = relatives
+        return response
+
+    async def _send(self, writer, responses, in_flight):
+        # responses go out in request order; once the connection is gone the
+        # rest are still awaited, to release the reader, but not written
+        while True:
+            response = await responses.get()
+            if response is None:
+                break
+            response = await response
+            in_flight.release()
+            if writer.is_closing():
+                continue
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
@@ -0,0 +1,113 @@
+from collections import namedtuple
+
+from family_tree.member import Member
+from family_tree.traversal import get_neighbours, iter_neighbourhood
+from family_tree.tree import FamilyTree
+
+# a standalone tree of copied members; links leaving the shard point at stubs,
+# members of the tree that only carry id, name and gender, whose ids are in stubs
+Shard = namedtuple("Shard", ["tree", "stubs"])
+
+
+def copy_members(members, cache_size=1024):
+    members = list(members)
+    copies = {member.id: Member(member.id, member.name, member.gender) for member in members}
+    stubs = set()
+
+    def copy_of(relative):
+        if relative is None:
+            return None
+        copy = copies.get(relative.id, None)
+        if copy is None:
+            copy = copies[relative.id] = Member(relative.id, relative.name, relative.gender)
+            stubs.add(relative.id)
+        return copy
+
+    for member in members:
+        copy = copies[member.id]
+        copy.mother = copy_of(member.mother)
+        copy.father = copy_of(member.father)
+        copy.spouse = copy_of(member.spouse)
+        copy.children.extend(copy_of(child) for child in member.children)
+
+    tree = FamilyTree(cache_size)
+    for copy in copies.values():
+        tree.add_member(copy)
+    return Shard(tree, frozenset(stubs))
+
+
+def find_components(tree):
+    # members connected through parent, spouse or child links, by union-find
+    roots = {member_id: member_id for member_id in tree.members}
+
+    def find(member_id):
+        while roots[member_id] != member_id:
+            roots[member_id] = roots[roots[member_id]]
+            member_id = roots[member_id]
+        return member_id
+
+    for member in tree:
+        root = find(member.id)
+        for relative in get_neighbours(member):
+            if relative.id in roots:
+                other = find(relative.id)
+                if other != root:
+                    roots[other] = root
+
+    components = {}
+    for member in tree:
+        components.setdefault(find(member.id), []).append(member)
+    return list(components.values())
+
+
+def find_lineages(tree):
+    # members grouped by the founder reached through mothers (fathers where
+    # there is no mother); married-in spouses head or join their own lineage
+    founders = {}
+    for member in tree:
+        path = []
+        on_path = set()
+        current = member
+        while current.id not in founders:
+            path.append(current)
+            on_path.add(current.id)
+            parent = current.mother if current.mother is not None else current.father
+            if parent is None or parent.id not in tree.members or parent.id in on_path:
+                founder = current.id
+                break
+            current = parent
+        else:
+            founder = founders[current.id]
+        for ancestor in path:
+            founders[ancestor.id] = founder
+
+    lineages = {}
+    for member in tree:
+        lineages.setdefault(founders[member.id], []).append(member)
+    return list(lineages.values())
+
+
+PARTITIONS = {"component": find_components, "lineage": find_lineages}
+
+
+def partition(tree, by="component", cache_size=1024):
+    # splits a tree into shards; returns the shards and the index of the
+    # shard holding each member in full
+    find_groups = PARTITIONS.get(by, None)
+    if find_groups is None:
+        raise ValueError("Unknown partitioning {}".format(by))
+    shards = []
+    assignment = {}
+    for index, members in enumerate(find_groups(tree)):
+        shards.append(copy_members(members, cache_size))
+        assignment.update((member.id, index) for member in members)
+    return shards, assignment
+
+
+def extract_subtree(tree, member_id, hops, cache_size=1024):
+    # everyone within hops links of the member, as a standalone shard
+    member = tree.get_member(member_id)
+    if member is None:
+        raise ValueError("Unknown member id {}".format(member_id))
+    members = [member] + [relative for relative, _ in iter_neighbourhood(member, hops)]
+    return copy_members(members, cache_size)
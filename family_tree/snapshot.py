@@ -0,0 +1,171 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from family_tree.store import ArrayStore
+
+MAGIC = b"MTFT"
+VERSION = 1
+BYTE_ORDERS = {"little": 0, "big": 1}
+# magic, version, byte order, members, children, distinct names, name bytes
+HEADER = struct.Struct("<4sIB3xQQQQ")
+ALIGNMENT = 8
+
+
+def _sections(members, children, names, name_bytes):
+    # (column, typecode, length) in file order; every column starts 8-byte aligned
+    return [
+        ("ids", "q", members),
+        ("name_ids", "i", members),
+        ("mothers", "i", members),
+        ("fathers", "i", members),
+        ("spouses", "i", members),
+        ("child_offsets", "i", members + 1),
+        ("child_indices", "i", children),
+        ("name_offsets", "q", names + 1),
+        ("genders", "b", members),
+        ("name_data", "B", name_bytes),
+    ]
+
+
+def _padding(size):
+    return -size % ALIGNMENT
+
+
+class NameTable:
+    # names column decoded on access from an interned name table
+    def __init__(self, name_ids, name_offsets, name_data):
+        self.name_ids = name_ids
+        self.name_offsets = name_offsets
+        self.name_data = name_data
+
+    def __len__(self):
+        return len(self.name_ids)
+
+    def __getitem__(self, index):
+        name_id = self.name_ids[index]
+        start = self.name_offsets[name_id]
+        end = self.name_offsets[name_id + 1]
+        return bytes(self.name_data[start:end]).decode("utf-8")
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def dumps(store):
+    name_ids = array("i")
+    name_offsets = array("q", [0])
+    name_data = bytearray()
+    interned = {}
+    for name in store.names:
+        name_id = interned.get(name, None)
+        if name_id is None:
+            name_id = interned[name] = len(interned)
+            name_data += name.encode("utf-8")
+            name_offsets.append(len(name_data))
+        name_ids.append(name_id)
+
+    columns = {
+        "ids": store.ids,
+        "name_ids": name_ids,
+        "mothers": store.mothers,
+        "fathers": store.fathers,
+        "spouses": store.spouses,
+        "child_offsets": store.child_offsets,
+        "child_indices": store.child_indices,
+        "name_offsets": name_offsets,
+        "genders": store.genders,
+        "name_data": name_data,
+    }
+    chunks = [HEADER.pack(MAGIC, VERSION, BYTE_ORDERS[sys.byteorder], len(store),
+                          len(store.child_indices), len(interned), len(name_data))]
+    size = HEADER.size
+    for column, typecode, _ in _sections(len(store), len(store.child_indices),
+                                         len(interned), len(name_data)):
+        chunks.append(b"\0" * _padding(size))
+        size += _padding(size)
+        data = array(typecode, columns[column]).tobytes()
+        chunks.append(data)
+        size += len(data)
+    return b"".join(chunks)
+
+
+def loads(buffer, views=None):
+    # the columns are memoryviews over the buffer, nothing is copied or decoded
+    base = memoryview(buffer)
+    if len(base) < HEADER.size:
+        raise ValueError("Truncated snapshot")
+    magic, version, byte_order, members, children, names, name_bytes = HEADER.unpack_from(base)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a family tree snapshot")
+    if byte_order != BYTE_ORDERS[sys.byteorder]:
+        raise ValueError("Snapshot was written on a machine with a different byte order")
+    sections = _sections(members, children, names, name_bytes)
+    size = HEADER.size
+    for _, typecode, length in sections:
+        size += _padding(size) + length * array(typecode).itemsize
+    if len(base) < size:
+        raise ValueError("Truncated snapshot")
+
+    views = views if views is not None else []
+    views.append(base)
+    columns = {}
+    offset = HEADER.size
+    for column, typecode, length in sections:
+        offset += _padding(offset)
+        size = length * array(typecode).itemsize
+        raw = base[offset:offset + size]
+        columns[column] = raw.cast(typecode)
+        views.extend((raw, columns[column]))
+        offset += size
+
+    return ArrayStore(
+        columns["ids"],
+        NameTable(columns["name_ids"], columns["name_offsets"], columns["name_data"]),
+        columns["genders"],
+        columns["mothers"],
+        columns["fathers"],
+        columns["spouses"],
+        columns["child_offsets"],
+        columns["child_indices"],
+    )
+
+
+def save_snapshot(tree, path):
+    store = tree if isinstance(tree, ArrayStore) else ArrayStore.from_tree(tree)
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(dumps(store))
+
+
+class Snapshot:
+    # a snapshot file mapped into memory; members are read lazily through
+    # self.store, so opening costs the same regardless of the tree size
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.views = []
+        self.store = loads(self.mmap, self.views)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        # the file is closed even when a caller still holds a view into the
+        # mapping; the mapping itself then goes once that view is released
+        self.store = None
+        try:
+            for view in reversed(self.views):
+                view.release()
+            self.views = []
+            self.mmap.close()
+        finally:
+            self.file.close()
+
+
+def open_snapshot(path):
+    return Snapshot(path)
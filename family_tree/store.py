@@ -0,0 +1,273 @@
+from array import array
+from bisect import bisect_left
+
+from family_tree.member import Gender, Relationship
+
+NO_MEMBER = -1
+GENDERS = (Gender.male, Gender.female)
+GENDER_CODES = {Gender.male: 0, Gender.female: 1}
+MALE = GENDER_CODES[Gender.male]
+FEMALE = GENDER_CODES[Gender.female]
+
+
+def _self(store, index):
+    return index
+
+
+def _mother(store, index):
+    return store.mothers[index]
+
+
+def _father(store, index):
+    return store.fathers[index]
+
+
+def _spouse(store, index):
+    return store.spouses[index]
+
+
+def _paternal_grandmother(store, index):
+    father = store.fathers[index]
+    if father == NO_MEMBER:
+        return NO_MEMBER
+    return store.mothers[father]
+
+
+def _maternal_grandmother(store, index):
+    mother = store.mothers[index]
+    if mother == NO_MEMBER:
+        return NO_MEMBER
+    return store.mothers[mother]
+
+
+def _spouse_mother(store, index):
+    spouse = store.spouses[index]
+    if spouse == NO_MEMBER:
+        return NO_MEMBER
+    return store.mothers[spouse]
+
+
+# relationship -> (whose children to look at, gender of the relatives, who to leave out)
+RELATIONSHIPS = {
+    "paternal_aunt": (_paternal_grandmother, FEMALE, None),
+    "paternal_uncle": (_paternal_grandmother, MALE, _father),
+    "maternal_aunt": (_maternal_grandmother, FEMALE, _mother),
+    "maternal_uncle": (_maternal_grandmother, MALE, None),
+    "brother_in_law": (_spouse_mother, MALE, _spouse),
+    "sister_in_law": (_spouse_mother, FEMALE, _spouse),
+    "son": (_self, MALE, None),
+    "daughter": (_self, FEMALE, None),
+    "siblings": (_mother, None, _self),
+}
+RELATIONSHIPS.update({Relationship[name]: value for name, value in list(RELATIONSHIPS.items())})
+
+
+class ArrayStore:
+    # columnar, read-only copy of a tree: one slot per member in each column,
+    # members sorted by id, relatives stored as indexes (NO_MEMBER if unset)
+    # and children kept in CSR form (child_offsets[i]:child_offsets[i + 1])
+    def __init__(self, ids, names, genders, mothers, fathers, spouses,
+                 child_offsets, child_indices):
+        self.ids = ids
+        self.names = names
+        self.genders = genders
+        self.mothers = mothers
+        self.fathers = fathers
+        self.spouses = spouses
+        self.child_offsets = child_offsets
+        self.child_indices = child_indices
+
+    @classmethod
+    def from_members(cls, members):
+        members = sorted(members, key=lambda x: x.id)
+        positions = {member.id: index for index, member in enumerate(members)}
+
+        def position(member):
+            if member is None:
+                return NO_MEMBER
+            index = positions.get(member.id, None)
+            if index is None:
+                raise ValueError("Member {} is not part of the tree".format(member.id))
+            return index
+
+        ids = array("q")
+        genders = array("b")
+        mothers = array("i")
+        fathers = array("i")
+        spouses = array("i")
+        child_offsets = array("i", [0])
+        child_indices = array("i")
+        names = []
+        for member in members:
+            ids.append(member.id)
+            names.append(member.name)
+            genders.append(GENDER_CODES[member.gender])
+            mothers.append(position(member.mother))
+            fathers.append(position(member.father))
+            spouses.append(position(member.spouse))
+            child_indices.extend(position(child) for child in member.children)
+            child_offsets.append(len(child_indices))
+
+        return cls(ids, names, genders, mothers, fathers, spouses,
+                   child_offsets, child_indices)
+
+    @classmethod
+    def from_tree(cls, tree):
+        return cls.from_members(tree)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def index_of(self, member_id):
+        index = bisect_left(self.ids, member_id)
+        if index < len(self.ids) and self.ids[index] == member_id:
+            return index
+        return NO_MEMBER
+
+    def view(self, index):
+        if index == NO_MEMBER:
+            return None
+        return MemberView(self, index)
+
+    def get_member(self, member_id):
+        return self.view(self.index_of(member_id))
+
+    def children(self, index):
+        children = self.child_indices[self.child_offsets[index]:self.child_offsets[index + 1]]
+        if isinstance(children, memoryview):
+            # a slice of a mapped snapshot would keep the mapping from closing
+            return children.tolist()
+        return children
+
+    def relatives(self, index, relationship_type):
+        relationship = RELATIONSHIPS.get(relationship_type, None)
+        if not relationship:
+            return []
+        anchor, gender, exclude = relationship
+        parent = anchor(self, index)
+        if parent == NO_MEMBER:
+            return []
+        excluded = exclude(self, index) if exclude else NO_MEMBER
+        genders = self.genders
+        return [child for child in self.children(parent)
+                if child != excluded and (gender is None or genders[child] == gender)]
+
+    def relatives_many(self, indexes, relationship_type):
+        # one dispatch for the whole batch; members sharing a parent (siblings,
+        # cousins) reuse the gender-filtered children of that parent, so the
+        # returned lists may be shared between members and must not be mutated
+        relationship = RELATIONSHIPS.get(relationship_type, None)
+        if not relationship:
+            return [[] for _ in indexes]
+        anchor, gender, exclude = relationship
+        genders = self.genders
+        filtered = {}
+        results = []
+        for index in indexes:
+            if index == NO_MEMBER:
+                results.append([])
+                continue
+            parent = anchor(self, index)
+            if parent == NO_MEMBER:
+                results.append([])
+                continue
+            children = filtered.get(parent, None)
+            if children is None:
+                children = [child for child in self.children(parent)
+                            if gender is None or genders[child] == gender]
+                filtered[parent] = children
+            excluded = exclude(self, index) if exclude else NO_MEMBER
+            if excluded in children:
+                results.append([child for child in children if child != excluded])
+            else:
+                results.append(children)
+        return results
+
+    def get_relationship(self, index, relationship_type):
+        return [MemberView(self, child) for child in self.relatives(index, relationship_type)]
+
+
+class MemberView:
+    # lightweight stand-in for a Member backed by an ArrayStore row
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __eq__(self, other):
+        return (isinstance(other, MemberView) and other.store is self.store and
+                other.index == self.index)
+
+    def __hash__(self):
+        return hash((id(self.store), self.index))
+
+    def __repr__(self):
+        return "MemberView({}, {!r})".format(self.id, self.name)
+
+    @property
+    def id(self):
+        return self.store.ids[self.index]
+
+    @property
+    def name(self):
+        return self.store.names[self.index]
+
+    @property
+    def gender(self):
+        return GENDERS[self.store.genders[self.index]]
+
+    @property
+    def mother(self):
+        return self.store.view(self.store.mothers[self.index])
+
+    @property
+    def father(self):
+        return self.store.view(self.store.fathers[self.index])
+
+    @property
+    def spouse(self):
+        return self.store.view(self.store.spouses[self.index])
+
+    @property
+    def children(self):
+        return [MemberView(self.store, child) for child in self.store.children(self.index)]
+
+    def get_paternal_grandmother(self):
+        return self.store.view(_paternal_grandmother(self.store, self.index))
+
+    def get_maternal_grandmother(self):
+        return self.store.view(_maternal_grandmother(self.store, self.index))
+
+    def get_spouse_mother(self):
+        return self.store.view(_spouse_mother(self.store, self.index))
+
+    def get_paternal_aunt(self):
+        return self.get_relationship("paternal_aunt")
+
+    def get_paternal_uncle(self):
+        return self.get_relationship("paternal_uncle")
+
+    def get_maternal_aunt(self):
+        return self.get_relationship("maternal_aunt")
+
+    def get_maternal_uncle(self):
+        return self.get_relationship("maternal_uncle")
+
+    def get_brother_in_law(self):
+        return self.get_relationship("brother_in_law")
+
+    def get_sister_in_law(self):
+        return self.get_relationship("sister_in_law")
+
+    def get_son(self):
+        return self.get_relationship("son")
+
+    def get_daughter(self):
+        return self.get_relationship("daughter")
+
+    def get_siblings(self):
+        return self.get_relationship("siblings")
+
+    def get_relationship(self, relationship_type):
+        return self.store.get_relationship(self.index, relationship_type)
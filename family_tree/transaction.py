@@ -0,0 +1,246 @@
+from family_tree.member import Member, Gender
+from family_tree.validate import ON_PATH, DONE
+
+
+class TransactionError(ValueError):
+    def __init__(self, errors):
+        super().__init__("Transaction rejected: " + "; ".join(errors))
+        self.errors = errors
+
+
+class Transaction:
+    # stages mutations by member id and applies them as a unit: commit checks
+    # everything in one pass against the tree plus the staged changes, then
+    # applies without the per-call checks of the Member setters
+    def __init__(self, tree):
+        self.tree = tree
+        self.operations = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def add_member(self, member):
+        if not isinstance(member, Member):
+            raise ValueError("Invalid value for member")
+        self.operations.append(("add_member", member, None))
+        return member
+
+    def set_mother(self, member_id, mother_id):
+        self.operations.append(("set_mother", member_id, mother_id))
+
+    def set_father(self, member_id, father_id):
+        self.operations.append(("set_father", member_id, father_id))
+
+    def set_spouse(self, member_id, spouse_id):
+        self.operations.append(("set_spouse", member_id, spouse_id))
+
+    def add_child(self, member_id, child_id):
+        self.operations.append(("add_child", member_id, child_id))
+
+    def rollback(self):
+        self.operations = []
+
+    def commit(self):
+        errors = self.validate()
+        if errors:
+            self.rollback()
+            raise TransactionError(errors)
+
+        undo = []
+        listed = set()
+        try:
+            for operation, member, other in self._resolve():
+                undo.append(self._apply(operation, member, other, listed))
+        except Exception:
+            for restore in reversed(undo):
+                restore()
+            raise
+        finally:
+            self.operations = []
+
+    def _resolve(self):
+        members = dict(self.tree.members)
+        for operation, subject, other_id in self.operations:
+            if operation == "add_member":
+                members[subject.id] = subject
+                yield operation, subject, None
+            else:
+                yield operation, members[subject], members[other_id]
+
+    def _apply(self, operation, member, other, listed):
+        tree = self.tree
+        if operation == "add_member":
+            tree.add_member(member)
+            return lambda: tree.remove_member(member.id)
+        if operation == "add_child":
+            key = (id(member.children), other.id)
+            if key in listed:
+                # already appended through the children list shared with the spouse
+                member._changed(operation, other)
+                return lambda: member._changed("remove_child", other)
+            listed.add(key)
+            member.children.append(other)
+            member._children_changed(operation, other)
+            return lambda: (member.children.pop(), member._children_changed("remove_child", other))
+
+        attribute = operation[len("set_"):]
+        previous = getattr(member, attribute)
+        if attribute == "spouse" and other is not previous:
+            member._unshare_children()
+        setattr(member, attribute, other)
+        member._changed(operation, other)
+        return lambda: (setattr(member, attribute, previous),
+                        member._changed(operation, previous))
+
+    def validate(self):
+        errors = []
+        members = self.tree.members
+        staged = {}
+        mothers = {}
+        fathers = {}
+        spouses = {}
+        children = {}
+
+        def get(member_id):
+            member = staged.get(member_id, None)
+            if member is None:
+                member = members.get(member_id, None)
+            if member is None:
+                errors.append("Unknown member id {}".format(member_id))
+            return member
+
+        def parent_id(member, parents, attribute):
+            if member.id in parents:
+                return parents[member.id]
+            parent = getattr(member, attribute)
+            return parent.id if parent is not None else None
+
+        for operation, subject, other_id in self.operations:
+            if operation == "add_member":
+                member = subject
+                if member.id in members or member.id in staged:
+                    errors.append("Member with id {} already exists".format(member.id))
+                else:
+                    staged[member.id] = member
+                continue
+
+            member, other = get(subject), get(other_id)
+            if member is None or other is None:
+                continue
+            if operation == "set_mother":
+                if other.gender != Gender.female:
+                    errors.append("Mother of {} should be a female!".format(member.id))
+                self._check_replace(member, mothers, "mother", other, errors)
+                mothers[member.id] = other.id
+            elif operation == "set_father":
+                if other.gender != Gender.male:
+                    errors.append("Father of {} should be a male!".format(member.id))
+                self._check_replace(member, fathers, "father", other, errors)
+                fathers[member.id] = other.id
+            elif operation == "set_spouse":
+                if other.gender == member.gender:
+                    errors.append("Invalid gender for spouse of {}".format(member.id))
+                spouses[member.id] = other.id
+            else:
+                listed = children.setdefault(member.id, set())
+                if other.id in listed or other in member.children:
+                    errors.append("{} is already a child of {}".format(other.id, member.id))
+                listed.add(other.id)
+
+        if errors:
+            return errors
+
+        # both sides of every staged link have to agree once everything is applied
+        for member_id, mother_id in mothers.items():
+            if not self._lists_child(mother_id, member_id, children):
+                errors.append("{} is not listed as a child of {}".format(member_id, mother_id))
+        for member_id, father_id in fathers.items():
+            if not self._lists_child(father_id, member_id, children):
+                errors.append("{} is not listed as a child of {}".format(member_id, father_id))
+        for member_id, listed in children.items():
+            for child_id in listed:
+                child = get(child_id)
+                if member_id not in (parent_id(child, mothers, "mother"),
+                                     parent_id(child, fathers, "father")):
+                    errors.append("{} does not have {} as a parent".format(child_id, member_id))
+        for member_id, spouse_id in spouses.items():
+            spouse = get(spouse_id)
+            if spouse_id in spouses:
+                current = spouses[spouse_id]
+            else:
+                current = spouse.spouse.id if spouse.spouse is not None else None
+            if current != member_id:
+                errors.append("Spouse of {} is not married to them".format(member_id))
+            # a former spouse has to be married off as well, or stay linked to them
+            former = get(member_id).spouse
+            if former is not None and former.id != spouse_id:
+                if former.id in spouses:
+                    former_spouse = spouses[former.id]
+                else:
+                    former_spouse = former.spouse.id if former.spouse is not None else None
+                if former_spouse == member_id:
+                    errors.append("Former spouse {} of {} would still be married to them"
+                                  .format(former.id, member_id))
+
+        # a new parent link must not make anyone their own ancestor: one
+        # three-colour depth-first search up the staged and existing links,
+        # where a link back to a member on the path closes a cycle
+        def parents_of(member_id):
+            member = get(member_id)
+            return iter([parent for parent in (parent_id(member, mothers, "mother"),
+                                               parent_id(member, fathers, "father"))
+                         if parent is not None])
+
+        state = {}
+        for start_id in set(mothers) | set(fathers):
+            if start_id in state:
+                continue
+            state[start_id] = ON_PATH
+            path = [start_id]
+            stack = [parents_of(start_id)]
+            while stack:
+                ancestor_id = next(stack[-1], None)
+                if ancestor_id is None:
+                    state[path.pop()] = DONE
+                    stack.pop()
+                    continue
+                colour = state.get(ancestor_id, None)
+                if colour is None:
+                    state[ancestor_id] = ON_PATH
+                    path.append(ancestor_id)
+                    stack.append(parents_of(ancestor_id))
+                elif colour == ON_PATH:
+                    # cycles already in the tree are left to family_tree.validate
+                    cycle = path[path.index(ancestor_id):]
+                    relinked = [x for x in cycle if x in mothers or x in fathers]
+                    if relinked:
+                        errors.append("{} would be their own ancestor".format(relinked[0]))
+        return errors
+
+    def _check_replace(self, member, parents, attribute, parent, errors):
+        current = getattr(member, attribute)
+        if member.id in parents:
+            current_id = parents[member.id]
+        else:
+            current_id = current.id if current is not None else None
+        if current_id is not None and current_id != parent.id:
+            errors.append("{} already has a {}".format(member.id, attribute))
+
+    def _lists_child(self, parent_id, child_id, children):
+        if child_id in children.get(parent_id, ()):
+            return True
+        parent = self.tree.members.get(parent_id, None)
+        if parent is None:
+            return False
+        if any(x.id == child_id for x in parent.children):
+            return True
+        # a children list shared with the spouse lists the child for both
+        spouse = parent.spouse
+        return (spouse is not None and spouse.children is parent.children
+                and child_id in children.get(spouse.id, ()))
@@ -0,0 +1,126 @@
+from collections import deque
+
+
+def get_parents(member):
+    return [parent for parent in (member.mother, member.father) if parent is not None]
+
+
+def _walk(member, next_members, max_depth):
+    # breadth-first, so each member is yielded once at its shortest distance;
+    # an explicit queue keeps deep trees clear of the recursion limit
+    visited = {member.id}
+    queue = deque([(member, 0)])
+    while queue:
+        current, depth = queue.popleft()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for relative in next_members(current):
+            if relative.id in visited:
+                continue
+            visited.add(relative.id)
+            yield relative, depth + 1
+            queue.append((relative, depth + 1))
+
+
+def iter_ancestors(member, max_depth=None):
+    return _walk(member, get_parents, max_depth)
+
+
+def iter_descendants(member, max_depth=None):
+    return _walk(member, lambda x: x.children, max_depth)
+
+
+def get_neighbours(member):
+    # everyone directly linked to member: parents, spouse and children
+    neighbours = get_parents(member)
+    if member.spouse is not None:
+        neighbours.append(member.spouse)
+    neighbours.extend(member.children)
+    return neighbours
+
+
+def iter_neighbourhood(member, max_depth=None):
+    return _walk(member, get_neighbours, max_depth)
+
+
+def get_ancestor_depths(member, max_depth=None):
+    depths = {member.id: 0}
+    for ancestor, depth in iter_ancestors(member, max_depth):
+        depths[ancestor.id] = depth
+    return depths
+
+
+def find_common_ancestor(member_a, member_b, max_depth=None):
+    # the closest shared ancestor (a member counts as their own ancestor at
+    # depth 0) as (ancestor, generations up from a, generations up from b)
+    depths_a = get_ancestor_depths(member_a, max_depth)
+    best = None
+    for ancestor, depth_b in _walk_with_self(member_b, max_depth):
+        if best is not None and depth_b >= best[1] + best[2]:
+            break
+        depth_a = depths_a.get(ancestor.id, None)
+        if depth_a is None:
+            continue
+        if best is None or depth_a + depth_b < best[1] + best[2]:
+            best = (ancestor, depth_a, depth_b)
+    return best
+
+
+def _walk_with_self(member, max_depth):
+    yield member, 0
+    for ancestor, depth in iter_ancestors(member, max_depth):
+        yield ancestor, depth
+
+
+def iter_cousins(member, degree=1):
+    # cousins of degree n share an ancestor n + 1 generations up on both sides
+    # and no closer one
+    generations = degree + 1
+    seen = {member.id}
+    for ancestor, depth in iter_ancestors(member, generations):
+        if depth != generations:
+            continue
+        for relative, relative_depth in iter_descendants(ancestor, generations):
+            if relative_depth != generations or relative.id in seen:
+                continue
+            seen.add(relative.id)
+            common = find_common_ancestor(member, relative, generations)
+            if common is not None and common[1] == generations and common[2] == generations:
+                yield relative
+
+
+def describe_relationship(generations_up, generations_down):
+    if generations_up == 0 and generations_down == 0:
+        return "self"
+    if generations_down == 0:
+        return _with_greats("parent", "grandparent", generations_up)
+    if generations_up == 0:
+        return _with_greats("child", "grandchild", generations_down)
+    if generations_up == 1 and generations_down == 1:
+        return "sibling"
+    if generations_up == 1:
+        return _with_greats("niece/nephew", "grandniece/grandnephew", generations_down - 1)
+    if generations_down == 1:
+        return _with_greats("aunt/uncle", "grandaunt/granduncle", generations_up - 1)
+
+    degree = min(generations_up, generations_down) - 1
+    removed = abs(generations_up - generations_down)
+    description = "cousin of degree {}".format(degree)
+    if removed == 1:
+        description += " once removed"
+    elif removed:
+        description += " {} times removed".format(removed)
+    return description
+
+
+def _with_greats(first, second, generations):
+    if generations == 1:
+        return first
+    return "great-" * (generations - 2) + second
+
+
+def get_relation(member_a, member_b, max_depth=None):
+    common = find_common_ancestor(member_a, member_b, max_depth)
+    if common is None:
+        return None
+    return describe_relationship(common[1], common[2])
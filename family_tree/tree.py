@@ -0,0 +1,268 @@
+from time import perf_counter
+
+from family_tree.cache import RelationshipCache
+from family_tree.member import Member, Gender, RELATIONSHIP_NAMES, relationship_name
+from family_tree.names import NameIndex
+from family_tree.store import ArrayStore, GENDERS, NO_MEMBER
+from family_tree.transaction import Transaction
+
+
+# members whose links a relationship result is read from, besides the member itself
+RELATIONSHIP_DEPENDENCIES = {
+    "paternal_aunt": ("father", "mother"),
+    "paternal_uncle": ("father", "mother"),
+    "maternal_aunt": ("mother", "mother"),
+    "maternal_uncle": ("mother", "mother"),
+    "brother_in_law": ("spouse", "mother"),
+    "sister_in_law": ("spouse", "mother"),
+    "son": (),
+    "daughter": (),
+    "siblings": ("mother",),
+}
+
+
+class FamilyTree:
+    def __init__(self, cache_size=1024):
+        self.members = {}
+        self.members_by_name = {}
+        self.members_by_gender = {Gender.male: {}, Gender.female: {}}
+        self.cache = RelationshipCache(cache_size)
+        self._store = None
+        # batch answers taken from the members while the store was stale
+        self._stale_lookups = 0
+        self._names = None
+        # callables notified as listener(member, operation, other) after every change
+        self.listeners = []
+        # instrumentation hooks, see family_tree.instrumentation
+        self.hooks = []
+
+    def __len__(self):
+        return len(self.members)
+
+    def __contains__(self, member_id):
+        return member_id in self.members
+
+    def __iter__(self):
+        return iter(self.members.values())
+
+    def add_member(self, member):
+        if not isinstance(member, Member):
+            raise ValueError("Invalid value for member")
+        if member.id in self.members:
+            raise ValueError("Member with id {} already exists".format(member.id))
+
+        self.members[member.id] = member
+        members = self.members_by_name.get(member.name, None)
+        if members is None:
+            members = self.members_by_name[member.name] = []
+            if self._names is not None:
+                self._names.add(member.name)
+        members.append(member)
+        self.members_by_gender[member.gender][member.id] = member
+        member.tree = self
+        self.member_changed(member, "add_member", None)
+        return member
+
+    def remove_member(self, member_id):
+        # only drops the member from the registry; links to it are left as they are
+        member = self.members.pop(member_id)
+        members = self.members_by_name[member.name]
+        members.remove(member)
+        if not members:
+            del self.members_by_name[member.name]
+            if self._names is not None:
+                self._names.discard(member.name)
+        del self.members_by_gender[member.gender][member.id]
+        self.member_changed(member, "remove_member", None)
+        member.tree = None
+        return member
+
+    def get_member(self, member_id):
+        return self.members.get(member_id, None)
+
+    def get_members_by_name(self, name):
+        return self.members_by_name.get(name, [])
+
+    def get_member_by_name(self, name):
+        members = self.members_by_name.get(name, None)
+        if not members:
+            return None
+        return members[0]
+
+    def find_members(self, text, prefix=False, ignore_case=False, limit=None):
+        # members by name: exact, starting with text (prefix) and/or ignoring
+        # case, ordered by name; the name index is built on the first such search
+        if not prefix and not ignore_case:
+            return self.get_members_by_name(text)[:limit]
+        names = self._names
+        if names is None:
+            names = self._names = NameIndex(self.members_by_name)
+        members = []
+        for name in names.iter_names(text, prefix, ignore_case):
+            members.extend(self.members_by_name[name])
+            if limit is not None and len(members) >= limit:
+                return members[:limit]
+        return members
+
+    def get_members_by_gender(self, gender):
+        return list(self.members_by_gender[Gender(gender)].values())
+
+    def get_relationship(self, member_id, relationship_type, strict=False):
+        relationship_type = RELATIONSHIP_NAMES.get(relationship_type, relationship_type)
+        if strict:
+            relationship_name(relationship_type, strict)
+        if not self.hooks:
+            return self._lookup(member_id, relationship_type)[0]
+
+        start = perf_counter()
+        result, cached = self._lookup(member_id, relationship_type)
+        seconds = perf_counter() - start
+        for hook in self.hooks:
+            hook.on_query(member_id, relationship_type, seconds, result, cached)
+        return result
+
+    def _lookup(self, member_id, relationship_type):
+        key = (member_id, relationship_type)
+        result = self.cache.get(key)
+        if result is not None:
+            return list(result), True
+        member = self.members.get(member_id, None)
+        if not member:
+            return None, False
+        result = member.get_relationship(relationship_type)
+        self.cache.put(key, result, self._dependencies(member, relationship_type))
+        return list(result), False
+
+    def _dependencies(self, member, relationship_type):
+        dependencies = [member.id]
+        for attribute in RELATIONSHIP_DEPENDENCIES.get(relationship_type, ()):
+            member = getattr(member, attribute)
+            if member is None:
+                break
+            dependencies.append(member.id)
+        return dependencies
+
+    def get_relationships(self, member_ids, relationship_type, strict=False):
+        relationship_type = RELATIONSHIP_NAMES.get(relationship_type, relationship_type)
+        if strict:
+            relationship_name(relationship_type, strict)
+        if not self.hooks:
+            return self._lookup_many(member_ids, relationship_type)
+
+        start = perf_counter()
+        results = self._lookup_many(member_ids, relationship_type)
+        seconds = perf_counter() - start
+        for hook in self.hooks:
+            hook.on_batch_query(relationship_type, len(results), seconds)
+        return results
+
+    def _lookup_many(self, member_ids, relationship_type):
+        member_ids = list(member_ids)
+        if self._store is None:
+            # while the array copy is stale, batches are answered member by
+            # member through the cache; it is only rebuilt once those answers
+            # add up to about the size of the tree, so writes between batches
+            # never put an O(n) rebuild on the query path
+            self._stale_lookups += len(member_ids)
+            if self._stale_lookups <= len(self.members):
+                return {member_id: self._lookup(member_id, relationship_type)[0]
+                        for member_id in member_ids}
+        store, members = self._get_store()
+        indexes = [store.index_of(member_id) for member_id in member_ids]
+        results = {}
+        for member_id, index, relatives in zip(member_ids, indexes,
+                                               store.relatives_many(indexes, relationship_type)):
+            if index == NO_MEMBER:
+                results[member_id] = None
+            else:
+                results[member_id] = [members[relative] for relative in relatives]
+        return results
+
+    def marry(self, member, spouse):
+        if not isinstance(member, Member) or not isinstance(spouse, Member):
+            raise ValueError("Invalid value for spouse")
+        if member.gender == spouse.gender:
+            raise ValueError("Invalid gender for spouse")
+        self._separate(member, spouse)
+        self._separate(spouse, member)
+        member.set_spouse(spouse)
+        spouse.set_spouse(member)
+        # a couple without children yet shares one children list from here on
+        if not member.children and not spouse.children:
+            spouse.children = member.children
+        return member
+
+    def _separate(self, member, spouse):
+        # ends any other marriage of member; set_spouse then gives member a
+        # children list apart from the former spouse
+        former = member.spouse
+        if former is None or former is spouse:
+            return
+        if former.spouse is member:
+            former.spouse = None
+            former._changed("set_spouse", None)
+
+    def link_child(self, mother, father, child):
+        # sets the child's parents and lists the child under both parents, once
+        # for a couple sharing their children list
+        child.set_mother(mother)
+        if father is not None:
+            child.set_father(father)
+        if (father is not None and father.children is mother.children
+                and father.spouse is mother and mother.spouse is father):
+            mother.add_child(child)
+            return child
+        # a child of someone else than the spouse is kept out of the spouse's list
+        mother._unshare_children()
+        mother.add_child(child)
+        if father is not None:
+            father._unshare_children()
+            father.add_child(child)
+        return child
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+        self.listeners.append(hook.on_mutation)
+        return hook
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+        self.listeners.remove(hook.on_mutation)
+
+    def member_changed(self, member, operation, other):
+        self.cache.invalidate(member.id)
+        self._store = None
+        self._stale_lookups = 0
+        for listener in self.listeners:
+            listener(member, operation, other)
+
+    def transaction(self):
+        return Transaction(self)
+
+    @classmethod
+    def from_store(cls, store, cache_size=1024):
+        # rebuilds full members from an array store, e.g. an opened snapshot
+        tree = cls(cache_size)
+        members = [Member(store.ids[index], store.names[index], GENDERS[store.genders[index]])
+                   for index in range(len(store))]
+        for index, member in enumerate(members):
+            mother, father, spouse = (store.mothers[index], store.fathers[index],
+                                      store.spouses[index])
+            member.mother = members[mother] if mother != NO_MEMBER else None
+            member.father = members[father] if father != NO_MEMBER else None
+            member.spouse = members[spouse] if spouse != NO_MEMBER else None
+            member.children.extend(members[child] for child in store.children(index))
+            tree.add_member(member)
+        return tree
+
+    def to_store(self):
+        return ArrayStore.from_tree(self)
+
+    def _get_store(self):
+        # array copy of the tree used for batch queries, rebuilt after mutations;
+        # the store and its members are swapped in together for concurrent readers
+        store = self._store
+        if store is None:
+            members = sorted(self.members.values(), key=lambda x: x.id)
+            store = self._store = (ArrayStore.from_members(members), members)
+        return store
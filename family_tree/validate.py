@@ -0,0 +1,133 @@
+from collections import namedtuple
+
+from family_tree.member import Gender
+from family_tree.traversal import get_parents
+
+# one broken rule: kind is one of the constants below, member_id the member
+# the violation was found on and other_id the relative involved
+Violation = namedtuple("Violation", ["kind", "member_id", "other_id"])
+
+CYCLE = "cycle"
+MOTHER_GENDER = "mother_gender"
+FATHER_GENDER = "father_gender"
+ASYMMETRIC_SPOUSE = "asymmetric_spouse"
+CHILD_PARENT_MISMATCH = "child_parent_mismatch"
+UNLISTED_CHILD = "unlisted_child"
+
+ON_PATH = 1
+DONE = 2
+
+
+class ChildIndex:
+    # (children list, child) pairs, filled one whole children list at a time
+    # on first use, so checking k siblings against their parent costs O(k)
+    def __init__(self):
+        self.pairs = set()
+        self.lists = set()
+
+    def lists_child(self, parent, child):
+        children = parent.children
+        if id(children) not in self.lists:
+            self.lists.add(id(children))
+            self.pairs.update((id(children), id(x)) for x in children)
+        return (id(children), id(child)) in self.pairs
+
+
+def check_member(member, children=None):
+    # the rules that only need the member and its direct relatives; pass one
+    # ChildIndex for all members checked together
+    if children is None:
+        children = ChildIndex()
+    violations = []
+    mother, father, spouse = member.mother, member.father, member.spouse
+    if mother is not None:
+        if mother.gender != Gender.female:
+            violations.append(Violation(MOTHER_GENDER, member.id, mother.id))
+        if not children.lists_child(mother, member):
+            violations.append(Violation(UNLISTED_CHILD, member.id, mother.id))
+    if father is not None:
+        if father.gender != Gender.male:
+            violations.append(Violation(FATHER_GENDER, member.id, father.id))
+        if not children.lists_child(father, member):
+            violations.append(Violation(UNLISTED_CHILD, member.id, father.id))
+    if spouse is not None and spouse.spouse is not member:
+        violations.append(Violation(ASYMMETRIC_SPOUSE, member.id, spouse.id))
+    for child in member.children:
+        if child.mother is not member and child.father is not member:
+            violations.append(Violation(CHILD_PARENT_MISMATCH, member.id, child.id))
+    return violations
+
+
+def find_cycles(members):
+    # iterative depth-first search up mother/father links with three colours
+    # (unseen, on the current path, done): a link back to a member on the
+    # path closes a cycle, and every member is expanded once
+    state = {}
+    violations = []
+    for start in members:
+        if start.id in state:
+            continue
+        state[start.id] = ON_PATH
+        stack = [(start, iter(get_parents(start)))]
+        while stack:
+            member, parents = stack[-1]
+            parent = next(parents, None)
+            if parent is None:
+                state[member.id] = DONE
+                stack.pop()
+                continue
+            colour = state.get(parent.id, None)
+            if colour is None:
+                state[parent.id] = ON_PATH
+                stack.append((parent, iter(get_parents(parent))))
+            elif colour == ON_PATH:
+                violations.append(Violation(CYCLE, member.id, parent.id))
+    return violations
+
+
+def validate(members):
+    # every violation among members, e.g. a whole tree, in O(n)
+    members = list(members)
+    violations = []
+    children = ChildIndex()
+    for member in members:
+        violations.extend(check_member(member, children))
+    violations.extend(find_cycles(members))
+    return violations
+
+
+class Validator:
+    # incremental checks of one tree: the first check() covers the whole tree,
+    # later ones only the members changed (or linked to) since the previous
+    # check. A link dropped by a change is only visible from the member still
+    # holding it, so e.g. the former spouse of a remarried member is left to
+    # the next full validate()
+    def __init__(self):
+        self.tree = None
+        self.touched = None
+
+    def attach(self, tree):
+        self.tree = tree
+        self.touched = None
+        tree.listeners.append(self.record)
+        return self
+
+    def detach(self):
+        self.tree.listeners.remove(self.record)
+        self.tree = None
+
+    def record(self, member, operation, other):
+        if self.touched is None:
+            return
+        self.touched.add(member.id)
+        if other is not None:
+            self.touched.add(other.id)
+
+    def check(self):
+        tree = self.tree
+        if self.touched is None:
+            members = list(tree)
+        else:
+            members = [tree.members[x] for x in self.touched if x in tree.members]
+        self.touched = set()
+        return validate(members)
@@ -9,7 +9,7 @@ class TestMember(TestCase):
         self.mother = Member(2, "Mother", "Female")
         self.father = Member(3, "Father", "Male")
         self.paternal_grandmother = Member(21, "PaternalGrandMother", "Female")
-        self.maternal_grandmother = Member(21, "MaternalGrandMother", "Female")
+        self.maternal_grandmother = Member(22, "MaternalGrandMother", "Female")
 
         self.mother_sister_a = Member(4, "MaternalAuntA", "Female")
         self.mother_sister_b = Member(5, "MaternalAuntB", "Female")
@@ -24,13 +24,13 @@ class TestMember(TestCase):
         self.spouse = Member(12, "Wife", "Female")
 
         self.brother_a = Member(13, "BroA", "Male")
-        self.brother_b = Member(13, "BroB", "Male")
-        self.sister_a = Member(13, "SisA", "Female")
-        self.sister_b = Member(13, "SisB", "Female")
-        self.son_a = Member(13, "SonA", "Male")
-        self.son_b = Member(13, "SonB", "Male")
-        self.daughter_a = Member(13, "DaughterA", "Female")
-        self.daughter_b = Member(13, "DaughterB", "Female")
+        self.brother_b = Member(14, "BroB", "Male")
+        self.sister_a = Member(15, "SisA", "Female")
+        self.sister_b = Member(16, "SisB", "Female")
+        self.son_a = Member(17, "SonA", "Male")
+        self.son_b = Member(18, "SonB", "Male")
+        self.daughter_a = Member(19, "DaughterA", "Female")
+        self.daughter_b = Member(20, "DaughterB", "Female")
 
         self.member.set_mother(self.mother)
         self.member.set_father(self.father)
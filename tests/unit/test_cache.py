@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from family_tree.cache import RelationshipCache
+
+
+class TestRelationshipCache(TestCase):
+
+    def setUp(self) -> None:
+        self.cache = RelationshipCache(maxsize=2)
+
+    def test_get_put(self):
+        self.assertEqual(self.cache.get((1, "son")), None)
+        self.cache.put((1, "son"), [2], [1])
+        self.assertEqual(self.cache.get((1, "son")), [2])
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_lru_eviction(self):
+        self.cache.put((1, "son"), [2], [1])
+        self.cache.put((1, "daughter"), [], [1])
+        self.cache.get((1, "son"))  # most recently used now
+        self.cache.put((3, "siblings"), [], [3, 4])
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual((1, "son") in self.cache, True)
+        self.assertEqual((1, "daughter") in self.cache, False)
+        self.assertEqual(self.cache.dependents, {1: {(1, "son")}, 3: {(3, "siblings")},
+                                                 4: {(3, "siblings")}})
+
+    def test_invalidate(self):
+        self.cache.put((1, "siblings"), [], [1, 4])
+        self.cache.put((2, "siblings"), [], [2, 5])
+        self.cache.invalidate(4)
+        self.assertEqual((1, "siblings") in self.cache, False)
+        self.assertEqual((2, "siblings") in self.cache, True)
+        self.assertEqual(self.cache.dependents, {2: {(2, "siblings")}, 5: {(2, "siblings")}})
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_disabled(self):
+        cache = RelationshipCache(maxsize=0)
+        cache.put((1, "son"), [2], [1])
+        self.assertEqual(len(cache), 0)
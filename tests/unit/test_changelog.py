@@ -0,0 +1,131 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from family_tree.changelog import Change, ChangeLog, apply_changes, diff
+from family_tree.member import Member
+from family_tree.snapshot import loads, dumps
+from family_tree.transaction import Transaction
+from family_tree.tree import FamilyTree
+from tests.unit.test_store import build_family
+
+
+def describe(tree):
+    # comparable summary of every member and link in a tree
+    return sorted((member.id, member.name, member.gender.value,
+                   member.mother.id if member.mother else None,
+                   member.father.id if member.father else None,
+                   member.spouse.id if member.spouse else None,
+                   tuple(x.id for x in member.children)) for member in tree)
+
+
+class TestChangeLog(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = build_family()
+        self.log = ChangeLog().attach(self.tree)
+
+    def make_changes(self):
+        daughter = self.tree.add_member(Member(10, "Daughter", "Female"))
+        daughter.set_mother(self.tree.get_member(8))
+        self.tree.get_member(8).add_child(daughter)
+
+    def test_record(self):
+        self.make_changes()
+        self.assertEqual(self.log.version, 3)
+        self.assertEqual(list(self.log), [
+            Change("add_member", 10, None, "Daughter", "Female"),
+            Change("set_mother", 10, 8),
+            Change("add_child", 8, 10),
+        ])
+        self.assertEqual(self.log.changes_since(2), [Change("add_child", 8, 10)])
+        self.log.detach()
+        self.tree.add_member(Member(11, "Other", "Male"))
+        self.assertEqual(self.log.version, 3)
+
+    def test_replay_onto_snapshot(self):
+        base = dumps(self.tree.to_store())
+        self.make_changes()
+        replica = FamilyTree.from_store(loads(base))
+        self.assertEqual(replica.get_relationship(8, "daughter"), [])
+
+        apply_changes(replica, self.log)
+        self.assertEqual(describe(replica), describe(self.tree))
+        self.assertEqual([x.name for x in replica.get_relationship(8, "daughter")],
+                         ["Daughter"])
+
+    def test_replay_shared_children(self):
+        replica = FamilyTree()
+        log = ChangeLog().attach(replica)
+        husband = replica.add_member(Member(1, "Husband", "Male"))
+        wife = replica.add_member(Member(2, "Wife", "Female"))
+        replica.marry(husband, wife)
+        replica.link_child(wife, husband, replica.add_member(Member(3, "Son", "Male")))
+        self.assertEqual(log.changes_since(5), [
+            Change("set_mother", 3, 2), Change("set_father", 3, 1),
+            Change("add_child", 2, 3), Change("add_child", 1, 3),
+        ])
+
+        # replayed onto separate lists as well as onto a shared one
+        separate = apply_changes(FamilyTree(), log)
+        self.assertEqual(describe(separate), describe(replica))
+        shared = FamilyTree()
+        shared.marry(shared.add_member(Member(1, "Husband", "Male")),
+                     shared.add_member(Member(2, "Wife", "Female")))
+        apply_changes(shared, log.changes_since(4))
+        self.assertEqual(describe(shared), describe(replica))
+
+    def test_write_and_read(self):
+        self.make_changes()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "changes.jsonl")
+            self.log.write(path, since=0)
+            self.assertEqual(list(ChangeLog.read(path)), list(self.log))
+
+    def test_transaction_undo_is_logged(self):
+        # undoing a half-applied transaction is recorded, so replicas stay equal
+        replica = FamilyTree.from_store(self.tree.to_store())
+        apply = Transaction._apply
+        calls = []
+
+        def failing_apply(transaction, operation, member, other, listed):
+            calls.append(operation)
+            if len(calls) == 3:
+                raise RuntimeError("disk full")
+            return apply(transaction, operation, member, other, listed)
+
+        transaction = self.tree.transaction()
+        transaction.add_member(Member(10, "Daughter", "Female"))
+        transaction.set_mother(10, 8)
+        transaction.add_child(8, 10)
+        with patch.object(Transaction, "_apply", failing_apply):
+            self.assertRaises(RuntimeError, transaction.commit)
+
+        self.assertEqual(10 in self.tree, False)
+        self.assertEqual(self.log.changes_since(2), [Change("set_mother", 10, None),
+                                                     Change("remove_member", 10)])
+        apply_changes(replica, self.log)
+        self.assertEqual(describe(replica), describe(self.tree))
+
+
+class TestDiff(TestCase):
+
+    def test_diff(self):
+        old = build_family()
+        new = FamilyTree.from_store(old.to_store())
+        daughter = new.add_member(Member(10, "Daughter", "Female"))
+        wife = new.get_member(8)
+        daughter.set_mother(wife)
+        wife.add_child(daughter)
+        new.get_member(9).set_mother(wife)
+        new.get_member(6).children.clear()
+        new.get_member(6).add_child(new.get_member(9))
+        uncle = new.remove_member(4)
+        new.get_member(1).children.remove(uncle)
+
+        changes = diff(old, new)
+        self.assertEqual(changes[0], Change("add_member", 10, None, "Daughter", "Female"))
+        self.assertEqual(changes[-1], Change("remove_member", 4))
+        self.assertEqual(describe(apply_changes(old, changes)), describe(new))
+        self.assertEqual(diff(new, FamilyTree.from_store(new.to_store())), [])
@@ -0,0 +1,67 @@
+import io
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from family_tree.cli import CommandProcessor, main
+from family_tree.member import Member
+from family_tree.tree import FamilyTree
+
+
+class TestCommandProcessor(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = FamilyTree()
+        self.queen = self.tree.add_member(Member(1, "Anga", "Female"))
+        self.king = self.tree.add_member(Member(2, "Shan", "Male"))
+        self.queen.set_spouse(self.king)
+        self.king.set_spouse(self.queen)
+        self.processor = CommandProcessor(self.tree)
+
+    def test_add_child(self):
+        self.assertEqual(self.processor.add_child("Anga", "Chit", "Male"), "CHILD_ADDED")
+        chit = self.tree.get_member_by_name("Chit")
+        self.assertEqual(chit.id, 3)
+        self.assertEqual(chit.mother, self.queen)
+        self.assertEqual(chit.father, self.king)
+        self.assertEqual(chit in self.king.children, True)
+
+        # failure cases
+        self.assertEqual(self.processor.add_child("Nobody", "Ish", "Male"), "PERSON_NOT_FOUND")
+        self.assertEqual(self.processor.add_child("Shan", "Ish", "Male"), "CHILD_ADDITION_FAILED")
+        self.assertEqual(self.processor.add_child("Anga", "Ish", "Other"),
+                         "CHILD_ADDITION_FAILED")
+
+    def test_get_relationship(self):
+        self.processor.add_child("Anga", "Chit", "Male")
+        self.processor.add_child("Anga", "Satya", "Female")
+        self.assertEqual(self.processor.get_relationship("Chit", "Siblings"), "Satya")
+        self.assertEqual(self.processor.get_relationship("Shan", "Son"), "Chit")
+        self.assertEqual(self.processor.get_relationship("Chit", "Paternal-Uncle"), "NONE")
+        self.assertEqual(self.processor.get_relationship("Nobody", "Son"), "PERSON_NOT_FOUND")
+
+    def test_run(self):
+        output = io.StringIO()
+        self.processor.run([
+            "ADD_CHILD Anga Chit Male\n",
+            "\n",
+            "GET_RELATIONSHIP Anga Son\n",
+            "GET_RELATIONSHIP Anga\n",
+            "REMOVE_CHILD Chit\n",
+        ], output)
+        self.assertEqual(output.getvalue(), "CHILD_ADDED\nChit\nINVALID_COMMAND\nINVALID_COMMAND\n")
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            tree_path = os.path.join(directory, "tree.csv")
+            commands_path = os.path.join(directory, "commands.txt")
+            with open(tree_path, "w") as tree_file:
+                tree_file.write("id,name,gender,mother_id,father_id,spouse_id\n"
+                                "1,Anga,Female,,,2\n2,Shan,Male,,,1\n")
+            with open(commands_path, "w") as commands_file:
+                commands_file.write("ADD_CHILD Anga Chit Male\nGET_RELATIONSHIP Shan Son\n")
+
+            with patch("sys.stdout", new_callable=io.StringIO) as output:
+                self.assertEqual(main([commands_path, "--tree", tree_path]), 0)
+            self.assertEqual(output.getvalue(), "CHILD_ADDED\nChit\n")
@@ -0,0 +1,118 @@
+import threading
+from unittest import TestCase
+
+from family_tree.concurrency import ReadWriteLock, ThreadSafeFamilyTree
+from family_tree.member import Member
+from family_tree.tree import FamilyTree
+
+
+class TestReadWriteLock(TestCase):
+
+    def setUp(self) -> None:
+        self.lock = ReadWriteLock()
+
+    def test_shared_readers(self):
+        inside = threading.Barrier(2, timeout=5)
+
+        def reader():
+            with self.lock.read_locked():
+                inside.wait()  # both readers hold the lock at once
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(inside.broken, False)
+
+    def test_writer_excludes_readers(self):
+        events = []
+        self.lock.acquire_read()
+        writer = threading.Thread(target=lambda: (self.lock.acquire_write(),
+                                                  events.append("write"),
+                                                  self.lock.release_write()))
+        writer.start()
+        writer.join(0.05)
+        self.assertEqual(events, [])  # still waiting for the reader
+        self.lock.release_read()
+        writer.join()
+        self.assertEqual(events, ["write"])
+
+    def test_reentrant(self):
+        # a reader reads again even while a writer waits
+        events = []
+        self.lock.acquire_read()
+        writer = threading.Thread(target=lambda: (self.lock.acquire_write(),
+                                                  events.append("write"),
+                                                  self.lock.release_write()))
+        writer.start()
+        writer.join(0.05)
+        with self.lock.read_locked():
+            events.append("read")
+        self.assertRaises(RuntimeError, self.lock.acquire_write)
+        self.lock.release_read()
+        writer.join(5)
+        self.assertEqual(events, ["read", "write"])
+
+        with self.lock.write_locked():
+            with self.lock.write_locked():
+                with self.lock.read_locked():
+                    events.append("nested")
+        with self.lock.write_locked():
+            events.append("again")
+        self.assertEqual(events[2:], ["nested", "again"])
+
+
+class TestThreadSafeFamilyTree(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = ThreadSafeFamilyTree(FamilyTree())
+        self.mother = self.tree.add_member(Member(1, "Mother", "Female"))
+
+    def test_queries(self):
+        self.assertEqual(len(self.tree), 1)
+        self.assertEqual(self.tree.get_member(1), self.mother)
+        self.assertEqual(self.tree.get_relationship(1, "daughter"), [])
+        self.assertEqual(self.tree.get_relationships([1], "daughter"), {1: []})
+
+    def test_calls_inside_read_and_write(self):
+        with self.tree.read():
+            self.assertEqual(self.tree.get_member(1), self.mother)
+            self.assertRaises(RuntimeError, self.tree.add_member, Member(3, "Other", "Male"))
+        with self.tree.write() as tree:
+            daughter = self.tree.add_member(Member(2, "Daughter", "Female"))
+            daughter.set_mother(self.mother)
+            self.mother.add_child(daughter)
+            self.assertEqual(self.tree.get_relationship(1, "daughter"), [daughter])
+            self.assertEqual(len(tree), 2)
+
+    def test_concurrent_batches(self):
+        # every batch links both sides, so readers must always see them agree
+        errors = []
+        done = threading.Event()
+
+        def writer():
+            for member_id in range(2, 202):
+                with self.tree.write() as tree:
+                    child = tree.add_member(Member(member_id, "Child", "Female"))
+                    child.set_mother(self.mother)
+                    self.mother.add_child(child)
+            done.set()
+
+        def reader():
+            while not done.is_set():
+                with self.tree.read() as tree:
+                    daughters = tree.get_relationship(1, "daughter")
+                    if len(daughters) != len(tree) - 1:
+                        errors.append(len(daughters))
+                    if any(daughter.mother is not self.mother for daughter in daughters):
+                        errors.append("unlinked")
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.tree.get_relationship(1, "daughter")), 200)
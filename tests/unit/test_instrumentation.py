@@ -0,0 +1,62 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from family_tree.instrumentation import QueryHook, QueryStats, SlowQueryLog
+from family_tree.member import Member
+from tests.unit.test_store import build_family
+
+
+class TestQueryStats(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = build_family()
+        self.stats = self.tree.add_hook(QueryStats())
+
+    def test_queries(self):
+        self.tree.get_relationship(6, "siblings")
+        self.tree.get_relationship(6, "siblings")
+        self.tree.get_relationship(6, "son")
+        self.tree.get_relationships([6, 7], "siblings")
+
+        summary = self.stats.summary()
+        self.assertEqual(summary["queries"], {"siblings": 2, "son": 1})
+        self.assertEqual(summary["cache_hit_rate"], {"siblings": 0.5, "son": 0.0})
+        self.assertEqual(summary["batch_queries"], {"siblings": 1})
+        self.assertEqual(summary["batch_members"], {"siblings": 2})
+        self.assertEqual(sum(summary["latency_histograms"]["siblings"]), 2)
+        self.assertEqual(sum(summary["batch_latency_histograms"]["siblings"]), 1)
+        self.assertAlmostEqual(self.stats.cache_hit_rate(), 1 / 3)
+
+    def test_mutations(self):
+        self.tree.add_member(Member(10, "Daughter", "Female"))
+        self.tree.get_member(10).set_mother(self.tree.get_member(8))
+        self.assertEqual(self.stats.summary()["mutations"], {"add_member": 1, "set_mother": 1})
+
+        self.tree.remove_hook(self.stats)
+        self.tree.get_relationship(6, "siblings")
+        self.assertEqual(self.stats.summary()["queries"], {})
+        self.assertEqual(self.tree.hooks, [])
+
+    def test_histogram_buckets(self):
+        self.stats.on_query(1, "son", 0.0000005, [], False)  # under 1us
+        self.stats.on_query(1, "son", 0.000003, [], False)  # 2-4us
+        self.stats.on_query(1, "son", 3600, [], False)  # clamped to the last bucket
+        histogram = self.stats.histograms["son"]
+        self.assertEqual((histogram[0], histogram[2], histogram[-1]), (1, 1, 1))
+
+
+class TestSlowQueryLog(TestCase):
+
+    def test_slow_queries(self):
+        log = Mock()
+        hook = SlowQueryLog(threshold=0.5, log=log)
+        hook.on_query(6, "siblings", 0.1, [], False)
+        log.warning.assert_not_called()
+        hook.on_query(6, "siblings", 0.7, [], False)
+        hook.on_batch_query("son", 100, 0.9)
+        self.assertEqual(log.warning.call_count, 2)
+
+    def test_base_hook(self):
+        tree = build_family()
+        tree.add_hook(QueryHook())
+        self.assertEqual([x.id for x in tree.get_relationship(6, "siblings")], [7])
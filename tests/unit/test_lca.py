@@ -0,0 +1,133 @@
+from unittest import TestCase
+
+from family_tree.lca import KinshipIndex, LineageIndex
+from family_tree.member import Member
+from family_tree.tree import FamilyTree
+
+
+class TestLineageIndex(TestCase):
+
+    def setUp(self) -> None:
+        # maternal chain 0 -> 1 -> ... -> 99 with a branch 50 -> 100 -> 101
+        self.members = [Member(0, "Root", "Female")]
+        for index in range(1, 100):
+            self.members.append(self.add_daughter(self.members[index - 1], index))
+        self.members.append(self.add_daughter(self.members[50], 100))
+        self.members.append(self.add_daughter(self.members[100], 101))
+        self.index = LineageIndex("mother").build(reversed(self.members))
+
+    def add_daughter(self, mother, member_id):
+        daughter = Member(member_id, "Daughter", "Female")
+        daughter.set_mother(mother)
+        mother.add_child(daughter)
+        return daughter
+
+    def test_build(self):
+        self.assertEqual(len(self.index), 102)
+        self.assertEqual(self.index.depth[99], 99)
+        self.assertEqual(self.index.depth[101], 52)
+        self.assertEqual(self.index.up[8], [7, 6, 4, 0])
+        self.assertEqual(self.index.lift(99, 40), 59)
+
+    def test_lca(self):
+        self.assertEqual(self.index.lca(99, 101), 50)
+        self.assertEqual(self.index.lca(101, 99), 50)
+        self.assertEqual(self.index.lca(99, 30), 30)
+        self.assertEqual(self.index.lca(51, 100), 50)
+        self.assertEqual(self.index.lca(7, 7), 7)
+        self.assertEqual(self.index.lca(7, 1000), None)
+
+        stranger = Member(1000, "Stranger", "Female")
+        self.index.add(stranger)
+        self.assertEqual(self.index.lca(7, 1000), None)
+
+    def test_add(self):
+        leaf = self.add_daughter(self.members[101], 102)
+        self.index.add(leaf)
+        self.assertEqual(self.index.depth[102], 53)
+        self.assertEqual(self.index.lca(102, 60), 50)
+
+        orphan_child = self.add_daughter(Member(2000, "Unknown", "Female"), 2001)
+        self.assertRaises(ValueError, self.index.add, orphan_child)
+
+    def test_cycle(self):
+        self.members[0].set_mother(self.members[99])
+        self.assertRaises(ValueError, LineageIndex("mother").build, self.members)
+
+
+class TestKinshipIndex(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = FamilyTree()
+        self.grandmother = self.add(1, "GrandMother", "Female")
+        self.grandfather = self.add(2, "GrandFather", "Male")
+        self.mother = self.add(3, "Mother", "Female", self.grandmother, self.grandfather)
+        self.uncle = self.add(4, "Uncle", "Male", self.grandmother, self.grandfather)
+        self.father = self.add(5, "Father", "Male")
+        self.aunt_in_law = self.add(6, "AuntInLaw", "Female")
+        self.member = self.add(7, "Zim", "Male", self.mother, self.father)
+        self.sister = self.add(8, "Sister", "Female", self.mother, self.father)
+        self.cousin = self.add(9, "Cousin", "Female", self.aunt_in_law, self.uncle)
+        self.index = KinshipIndex(self.tree)
+
+    def add(self, member_id, name, gender, mother=None, father=None):
+        member = self.tree.add_member(Member(member_id, name, gender))
+        for parent, set_parent in ((mother, member.set_mother), (father, member.set_father)):
+            if parent:
+                set_parent(parent)
+                parent.add_child(member)
+        return member
+
+    def test_find_common_ancestor(self):
+        self.assertEqual(self.index.find_common_ancestor(self.member, self.sister),
+                         (self.mother, 1, 1))
+        # mother's brother's daughter: no single lineage connects them
+        self.assertEqual(self.index.find_common_ancestor(self.member, self.cousin)[1:], (2, 2))
+        self.assertEqual(self.index.find_common_ancestor(self.member, self.aunt_in_law), None)
+
+    def test_closer_mixed_ancestor(self):
+        # the maternal lines of the cousins also meet, one generation higher
+        great_grandmother = self.add(11, "GreatGrandMother", "Female")
+        self.grandmother.set_mother(great_grandmother)
+        great_grandmother.add_child(self.grandmother)
+        self.aunt_in_law.set_mother(self.add(12, "GrandAunt", "Female", great_grandmother))
+        self.aunt_in_law.mother.add_child(self.aunt_in_law)
+        index = KinshipIndex(self.tree)
+        self.assertEqual(index.find_common_ancestor(self.member, self.cousin)[1:], (2, 2))
+        self.assertEqual(index.get_relation(self.member, self.cousin), "cousin of degree 1")
+
+    def test_are_blood_relatives(self):
+        self.assertEqual(self.index.are_blood_relatives(self.member, self.sister), True)
+        self.assertEqual(self.index.are_blood_relatives(self.member, self.cousin), True)
+        self.assertEqual(self.index.are_blood_relatives(self.member, self.father), True)
+        self.assertEqual(self.index.are_blood_relatives(self.mother, self.father), False)
+
+        # other families are told apart without a traversal
+        stranger = self.add(20, "Stranger", "Male")
+        self.index.add(stranger)
+        self.assertEqual(self.index.are_blood_relatives(self.member, stranger), False)
+        self.assertEqual(self.index.find_common_ancestor(self.member, stranger), None)
+
+    def test_add(self):
+        son = self.add(10, "Son", "Male", self.sister)
+        self.index.add(son)
+        self.assertEqual(self.index.get_relation(self.member, son), "niece/nephew")
+        self.assertEqual(self.index.get_relation(son, self.grandmother), "great-grandparent")
+
+    def test_follows_tree(self):
+        # members linked after the index was built are found without add()
+        son = self.add(10, "Son", "Male", self.sister)
+        self.assertEqual(self.index.get_relation(self.member, son), "niece/nephew")
+        self.assertEqual(self.index.stale, False)
+
+        # a new parent above existing members rebuilds the index
+        great_grandmother = self.add(11, "GreatGrandMother", "Female")
+        self.grandmother.set_mother(great_grandmother)
+        great_grandmother.add_child(self.grandmother)
+        self.assertEqual(self.index.stale, True)
+        self.assertEqual(self.index.get_relation(son, great_grandmother),
+                         "great-great-grandparent")
+
+        self.index.detach()
+        stranger = self.add(20, "Stranger", "Male")
+        self.assertRaises(ValueError, self.index.are_blood_relatives, self.member, stranger)
@@ -0,0 +1,144 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from family_tree.changelog import ChangeLog, apply_changes
+from family_tree.loader import load_csv, load_jsonl, load_records, load_tree
+from family_tree.member import Gender, Member
+from family_tree.tree import FamilyTree
+
+CSV_DATA = """id,name,gender,mother_id,father_id,spouse_id
+3,Son,Male,1,2,
+1,Mother,Female,,,2
+2,Father,Male,,,1
+4,Daughter,Female,1,2,
+"""
+
+JSONL_RECORDS = [
+    {"id": 1, "name": "Mother", "gender": "Female", "spouse_id": 2},
+    {"id": 2, "name": "Father", "gender": "Male", "spouse_id": 1},
+    {"id": 3, "name": "Son", "gender": "Male", "mother_id": 1, "father_id": 2},
+]
+
+
+class TestLoader(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, file_name, content):
+        path = os.path.join(self.directory.name, file_name)
+        with open(path, "w") as data_file:
+            data_file.write(content)
+        return path
+
+    def test_load_csv(self):
+        tree = load_csv(self.write("tree.csv", CSV_DATA))
+        mother, father, son = tree.get_member(1), tree.get_member(2), tree.get_member(3)
+
+        self.assertEqual(len(tree), 4)
+        self.assertEqual(son.mother, mother)
+        self.assertEqual(son.father, father)
+        self.assertEqual(mother.spouse, father)
+        self.assertEqual(father.spouse, mother)
+        self.assertEqual(son.gender, Gender.male)
+        # forward references are resolved in file order
+        self.assertEqual([child.name for child in mother.children], ["Son", "Daughter"])
+        self.assertEqual([child.name for child in father.children], ["Son", "Daughter"])
+        self.assertEqual(len(son.get_relationship("siblings")), 1)
+
+    def test_load_jsonl(self):
+        content = "\n".join(json.dumps(record) for record in JSONL_RECORDS) + "\n"
+        tree = load_jsonl(self.write("tree.jsonl", content))
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(tree.get_member(3).mother.name, "Mother")
+        self.assertEqual(tree.get_member(1).spouse.name, "Father")
+
+    def test_load_tree(self):
+        self.assertEqual(len(load_tree(self.write("tree.csv", CSV_DATA))), 4)
+        content = "\n".join(json.dumps(record) for record in JSONL_RECORDS)
+        self.assertEqual(len(load_tree(self.write("tree.jsonl", content))), 3)
+
+    def test_load_records_failure(self):
+        # all errors are reported at once
+        with self.assertRaises(ValueError) as context:
+            load_records([
+                {"id": 1, "name": "Father", "gender": "Male"},
+                {"id": 2, "name": "Son", "gender": "Male", "mother_id": 1, "father_id": 9},
+            ])
+        self.assertIn("Mother of 2 should be a female!", str(context.exception))
+        self.assertIn("Unknown member id 9", str(context.exception))
+
+        self.assertRaises(ValueError, load_records, [
+            {"id": 1, "name": "A", "gender": "Male", "spouse_id": 2},
+            {"id": 2, "name": "B", "gender": "Male"},
+        ])
+        self.assertRaises(ValueError, load_records, [
+            {"id": 1, "name": "A", "gender": "Male"},
+            {"id": 1, "name": "B", "gender": "Male"},
+        ])
+
+    def test_load_records_spouses(self):
+        with self.assertRaises(ValueError) as context:
+            load_records([
+                {"id": 1, "name": "A", "gender": "Male", "spouse_id": 2},
+                {"id": 2, "name": "B", "gender": "Female", "spouse_id": 1},
+                {"id": 3, "name": "C", "gender": "Male", "spouse_id": 2},
+            ])
+        self.assertIn("Spouse of 3 is married to someone else", str(context.exception))
+
+    def test_load_records_errors_together(self):
+        with self.assertRaises(ValueError) as context:
+            load_records([
+                {"id": 1, "name": "A", "gender": "Unknown"},
+                {"id": 2, "name": "B", "gender": "Male"},
+                {"id": 2, "name": "C", "gender": "Male"},
+                {"id": 3, "name": "D", "gender": "Male", "mother_id": 9},
+            ])
+        message = str(context.exception)
+        self.assertIn("Invalid record", message)
+        self.assertIn("Member with id 2 already exists", message)
+        self.assertIn("Unknown member id 9", message)
+
+    def test_load_records_into_tree(self):
+        tree = FamilyTree()
+        mother = tree.add_member(Member(1, "Mother", "Female"))
+        load_records([{"id": 2, "name": "Son", "gender": "Male", "mother_id": 1}], tree)
+        self.assertEqual([x.id for x in mother.children], [2])
+        self.assertEqual(tree.get_relationship(1, "son"), [tree.get_member(2)])
+
+        # a rejected load leaves the tree as it was
+        self.assertRaises(ValueError, load_records, [
+            {"id": 3, "name": "Daughter", "gender": "Female", "mother_id": 1},
+            {"id": 4, "name": "Husband", "gender": "Male", "spouse_id": 1},
+            {"id": 5, "name": "Other", "gender": "Male", "spouse_id": 1},
+        ], tree)
+        self.assertEqual(len(tree), 2)
+        self.assertEqual([x.id for x in mother.children], [2])
+        self.assertEqual(mother.spouse, None)
+
+    def test_load_records_into_married_couple(self):
+        tree = FamilyTree()
+        father = tree.add_member(Member(1, "Father", "Male"))
+        mother = tree.add_member(Member(2, "Mother", "Female"))
+        tree.marry(father, mother)
+        load_records([{"id": "3", "name": "Son", "gender": "Male",
+                       "mother_id": "2", "father_id": "1"}], tree)
+        self.assertEqual([x.id for x in father.children], [3])
+        self.assertEqual(tree.get_relationship(1, "son"), [tree.get_member(3)])
+
+    def test_load_records_notifies(self):
+        tree = FamilyTree()
+        log = ChangeLog().attach(tree)
+        load_records(JSONL_RECORDS, tree)
+        self.assertEqual(len([x for x in log if x.operation == "add_child"]), 2)
+        self.assertEqual(len([x for x in log if x.operation == "set_spouse"]), 2)
+
+        replica = apply_changes(FamilyTree(), log)
+        self.assertEqual([x.id for x in replica.get_relationship(1, "son")], [3])
+        self.assertEqual(replica.get_member(2).spouse.id, 1)
+        self.assertEqual([x.id for x in replica.get_member(2).children], [3])
@@ -0,0 +1,43 @@
+import csv
+import os
+import tempfile
+from unittest import TestCase
+
+from family_tree.materialize import iter_edges, iter_generations, write_edges
+from family_tree.member import Relationship
+from family_tree.store import ArrayStore
+from tests.unit.test_store import build_family
+
+
+class TestMaterialize(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = build_family()
+        self.expected = sorted((member.id, x.name, relative.id)
+                               for member in self.tree for x in Relationship
+                               for relative in member.get_relationship(x.name))
+
+    def test_iter_generations(self):
+        store = ArrayStore.from_tree(self.tree)
+        generations = [sorted(store.ids[x] for x in generation)
+                       for generation in iter_generations(store)]
+        self.assertEqual(generations, [[1, 5, 8], [2, 3, 4], [6, 7], [9]])
+
+    def test_iter_edges(self):
+        self.assertEqual(sorted(iter_edges(self.tree)), self.expected)
+        self.assertEqual(sorted(iter_edges(ArrayStore.from_tree(self.tree), ["son"])),
+                         [(1, "son", 4), (2, "son", 6), (5, "son", 6), (6, "son", 9)])
+        self.assertRaises(ValueError, list, iter_edges(self.tree, ["cousin"]))
+
+    def test_write_edges(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = write_edges(self.tree, directory, chunk_size=2)
+            self.assertEqual(len(paths), (len(self.expected) + 1) // 2)
+            self.assertEqual(os.path.basename(paths[0]), "part-00000.csv")
+            rows = []
+            for path in paths:
+                with open(path, newline="") as part_file:
+                    reader = csv.reader(part_file)
+                    self.assertEqual(next(reader), ["member_id", "relationship", "relative_id"])
+                    rows.extend((int(x), name, int(y)) for x, name, y in reader)
+            self.assertEqual(sorted(rows), self.expected)
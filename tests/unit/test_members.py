@@ -1,6 +1,8 @@
+import copy
+import pickle
 from unittest import TestCase
 from unittest.mock import patch, Mock
-from family_tree.member import Member, Gender
+from family_tree.member import Children, Member, Gender, Relationship, relationship_name
 
 
 def create_fake_member(id=None, name=None, gender=None, mother=None,
@@ -12,7 +14,7 @@ def create_fake_member(id=None, name=None, gender=None, mother=None,
     member.mother = mother
     member.spouse = spouse
     member.father = father
-    member.children = children
+    member.children = Children(children) if children is not None else None
     return member
 
 
@@ -163,8 +165,8 @@ class TestMember(TestCase):
         create_fake_member(),
         create_fake_member(children=[Member(3, "Dad", "Male")]),
         create_fake_member(children=[
-            Member(3, "Aunt", "Female"),
-            Member(4, "Dad", "Male")
+            Member(4, "Aunt", "Female"),
+            Member(3, "Dad", "Male")
         ]),
         create_fake_member(children=[
             Member(3, "Dad", "Male"),
@@ -335,6 +337,14 @@ class TestMember(TestCase):
         siblings = member.get_siblings()
         self.assertEqual(len(siblings), 2)
 
+        # a sibling sharing the member's name is still a sibling
+        namesake = Member(9, "Dummy", "Male")
+        namesake.mother = mother
+        mother.children.append(namesake)
+        self.assertEqual(namesake in member.get_siblings(), True)
+        self.assertEqual(member in namesake.get_siblings(), True)
+        self.assertEqual(namesake in namesake.get_siblings(), False)
+
     # mock moves from bottom to top
     @patch("family_tree.member.Member.get_siblings")
     @patch("family_tree.member.Member.get_daughter")
@@ -368,3 +378,98 @@ class TestMember(TestCase):
         mock_get_daughter.assert_called_with()
         self.member.get_relationship("siblings")
         mock_get_siblings.assert_called_with()
+
+    def test_children_partitions(self):
+        son = Member(6, "Son", "Male")
+        daughter = Member(7, "Daughter", "Female")
+        children = Children([son])
+        self.assertEqual(children, [son])
+        self.assertEqual(children.males, [son])
+        self.assertEqual(children.females, [])
+
+        children.append(daughter)
+        self.assertEqual(children.of_gender(Gender.female), [daughter])
+        children.remove(son)
+        self.assertEqual(children, [daughter])
+        self.assertEqual(children.males, [])
+        children += [son]
+        self.assertEqual(children.males, [son])
+        children.clear()
+        self.assertEqual(children.females, [])
+
+    def test_children_copy(self):
+        son = Member(6, "Son", "Male")
+        children = Children([son])
+        self.assertEqual(children.males, [son])
+        for other in (copy.copy(children), copy.deepcopy(children),
+                      pickle.loads(pickle.dumps(children))):
+            self.assertEqual(isinstance(other, Children), True)
+            self.assertEqual(len(other), 1)
+            self.assertEqual(len(other.males), 1)
+            self.assertEqual(other.females, [])
+
+    def test_sibling_group(self):
+        mother = Member(8, "Mom", "Female")
+        self.assertEqual(self.member.sibling_group, None)
+        self.member.set_mother(mother)
+        mother.add_child(self.member)
+        self.assertIs(self.member.sibling_group, mother.children)
+
+    def test_iter_relationship(self):
+        son = Member(6, "Son", "Male")
+        daughter = Member(7, "Daughter", "Female")
+        self.member.add_child(son)
+        self.member.add_child(daughter)
+
+        sons = self.member.iter_son()
+        self.assertEqual(isinstance(sons, list), False)
+        self.assertEqual(list(sons), [son])
+        self.assertEqual(list(self.member.iter_relationship("daughter")), [daughter])
+        self.assertEqual(list(self.member.iter_relationship("invalid_relation")), [])
+        self.assertEqual(list(self.member.iter_siblings()), [])
+
+    def test_count_and_has_relationship(self):
+        self.assertEqual(self.member.count_relationship("son"), 0)
+        self.assertEqual(self.member.has_relationship("son"), False)
+        self.member.add_child(Member(6, "SonA", "Male"))
+        self.member.add_child(Member(7, "SonB", "Male"))
+        self.assertEqual(self.member.count_relationship("son"), 2)
+        self.assertEqual(self.member.has_relationship("son"), True)
+        self.assertEqual(self.member.has_relationship("daughter"), False)
+        self.assertEqual(self.member.count_relationship("invalid_relation"), 0)
+
+    def test_relationship_enum(self):
+        son = Member(6, "Son", "Male")
+        self.member.add_child(son)
+        self.assertEqual(self.member.get_relationship(Relationship.son), [son])
+        self.assertEqual(list(self.member.iter_relationship(Relationship.son)), [son])
+        self.assertEqual(Relationship.son, 7)
+        self.assertEqual(relationship_name(Relationship.son), "son")
+        self.assertEqual(relationship_name("son"), "son")
+        self.assertEqual(relationship_name("cousin"), None)
+
+    def test_strict_relationship(self):
+        self.assertEqual(self.member.get_relationship("cousin"), [])
+        self.assertRaises(ValueError, self.member.get_relationship, "cousin", strict=True)
+        self.assertRaises(ValueError, self.member.iter_relationship, "cousin", strict=True)
+        self.assertEqual(self.member.get_relationship("son", strict=True), [])
+
+    def test_get_composed_relationship(self):
+        mother = Member(8, "Mom", "Female")
+        sister = Member(9, "Sister", "Female")
+        nephew = Member(10, "Nephew", "Male")
+        niece = Member(11, "Niece", "Female")
+        for child in (self.member, sister):
+            child.set_mother(mother)
+            mother.add_child(child)
+        for child in (nephew, niece):
+            child.set_mother(sister)
+            sister.add_child(child)
+
+        self.assertEqual(self.member.get_composed_relationship(["siblings", "son"]), [nephew])
+        self.assertEqual(self.member.get_composed_relationship(
+            [Relationship.siblings, Relationship.daughter]), [niece])
+        # the member is not their own sibling's sibling
+        self.assertEqual(self.member.get_composed_relationship(["siblings", "siblings"]), [])
+        self.assertRaises(ValueError, self.member.get_composed_relationship,
+                          ["siblings", "cousin"], strict=True)
@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+from family_tree.names import NameIndex, SortedKeys
+
+
+class TestNameIndex(TestCase):
+
+    def setUp(self) -> None:
+        self.index = NameIndex(["Chit", "Chitra", "chit", "Amba", "Vich"])
+
+    def test_iter_names(self):
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(list(self.index.iter_names("Chit")), ["Chit"])
+        self.assertEqual(list(self.index.iter_names("Chi")), [])
+        self.assertEqual(list(self.index.iter_names("Chi", prefix=True)), ["Chit", "Chitra"])
+        self.assertEqual(list(self.index.iter_names("CHIT", ignore_case=True)), ["Chit", "chit"])
+        self.assertEqual(list(self.index.iter_names("ch", prefix=True, ignore_case=True)),
+                         ["Chit", "chit", "Chitra"])
+        self.assertEqual(list(self.index.iter_names("Zim", prefix=True)), [])
+        self.assertEqual(list(self.index.iter_names("zim", ignore_case=True)), [])
+
+    def test_add_and_discard(self):
+        self.index.add("CHITRA")
+        self.index.add("Bela")
+        self.assertEqual(list(self.index.names), sorted(["Chit", "Chitra", "chit", "Amba", "Vich",
+                                                   "CHITRA", "Bela"]))
+        self.assertEqual(list(self.index.iter_names("chitra", ignore_case=True)),
+                         ["CHITRA", "Chitra"])
+        self.index.discard("Chitra")
+        self.index.discard("CHITRA")
+        self.index.discard("Nobody")
+        self.assertEqual(list(self.index.iter_names("chi", prefix=True, ignore_case=True)),
+                         ["Chit", "chit"])
+        self.assertEqual(list(self.index.folded_names), ["amba", "bela", "chit", "vich"])
+
+
+class TestSortedKeys(TestCase):
+
+    def test_updates(self):
+        keys = SortedKeys("key{:03d}".format(x) for x in range(0, 200, 2))
+        for x in range(1, 200, 2):
+            keys.add("key{:03d}".format(x))
+        for x in range(0, 200, 3):
+            keys.discard("key{:03d}".format(x))
+        keys.add("key000")
+        keys.discard("missing")
+        expected = sorted(["key000"] + ["key{:03d}".format(x) for x in range(200) if x % 3])
+        self.assertEqual(list(keys), expected)
+        self.assertEqual(len(keys), len(expected))
+        self.assertEqual("key000" in keys, True)
+        self.assertEqual("key003" in keys, False)
+        self.assertEqual(list(keys.starting_with("key19")),
+                         [x for x in expected if x.startswith("key19")])
@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from family_tree.server import QueryServer
+from tests.unit.test_store import build_family
+
+
+class TestQueryServer(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = build_family()
+        self.server = QueryServer(self.tree, workers=2, chunk_size=2)
+
+    def tearDown(self) -> None:
+        self.server.close()
+
+    def test_get_relationship(self):
+        self.assertEqual(self.server.get_relationship(6, "siblings"), [7])
+        self.assertEqual(self.server.get_relationship(6, "maternal_uncle"), [4])
+        self.assertEqual(self.server.get_relationship(42, "siblings"), None)
+
+    def test_get_relationships(self):
+        member_ids = [member.id for member in self.tree] + [42]
+        expected = {member.id: [x.id for x in member.get_relationship("siblings")]
+                    for member in self.tree}
+        expected[42] = None
+        self.assertEqual(self.server.get_relationships(member_ids, "siblings"), expected)
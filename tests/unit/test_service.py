@@ -0,0 +1,124 @@
+import asyncio
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from family_tree.service import RelationshipService
+from tests.unit.test_store import build_family
+
+
+class TestRelationshipService(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = build_family()
+
+    def run_service(self, coroutine):
+        return asyncio.run(coroutine)
+
+    async def exchange(self, reader, writer, requests):
+        writer.write(b"".join(json.dumps(x).encode("utf-8") + b"\n" for x in requests))
+        await writer.drain()
+        return [json.loads(await reader.readline()) for _ in requests]
+
+    def test_query_batches(self):
+        async def scenario():
+            service = RelationshipService(self.tree, batch_window=0.01)
+            service._prepare()
+            answers = await asyncio.gather(service.query(6, "siblings"),
+                                           service.query(7, "siblings"),
+                                           service.query(42, "siblings"),
+                                           service.query(6, "maternal_aunt"))
+            await service.close()
+            return answers
+
+        self.assertEqual(self.run_service(scenario()), [[7], [6], None, [3]])
+
+    def test_tcp(self):
+        async def scenario():
+            service = RelationshipService(self.tree)
+            server = await service.start()
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = await self.exchange(reader, writer, [
+                {"member_id": 6, "relationship": "siblings", "request_id": "a"},
+                {"member_id": 6, "relationship": "son"},
+                {"member": 6},
+                {"member_id": [6], "relationship": "son"},
+            ])
+            writer.close()
+            await service.close()
+            return responses
+
+        self.assertEqual(self.run_service(scenario()), [
+            {"member_id": 6, "relationship": "siblings", "request_id": "a", "relatives": [7]},
+            {"member_id": 6, "relationship": "son", "relatives": [9]},
+            {"error": "Invalid request"},
+            {"error": "Invalid request"},
+        ])
+
+    def test_close_with_open_connection(self):
+        async def scenario():
+            errors = []
+            asyncio.get_running_loop().set_exception_handler(
+                lambda loop, context: errors.append(context))
+            service = RelationshipService(self.tree)
+            server = await service.start()
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = await self.exchange(reader, writer, [
+                {"member_id": 6, "relationship": "siblings"}])
+            await service.close()
+            end = await reader.readline()
+            writer.close()
+            return responses, end, service.handlers, errors
+
+        self.assertEqual(self.run_service(scenario()), (
+            [{"member_id": 6, "relationship": "siblings", "relatives": [7]}], b"", {}, []))
+
+    def test_unix_socket(self):
+        async def scenario(path):
+            service = RelationshipService(self.tree, max_in_flight=1)
+            await service.start_unix(path)
+            reader, writer = await asyncio.open_unix_connection(path)
+            responses = await self.exchange(reader, writer, [
+                {"member_id": 7, "relationship": "siblings"},
+                {"member_id": 42, "relationship": "siblings"},
+            ])
+            writer.close()
+            await service.close()
+            return responses
+
+        with tempfile.TemporaryDirectory() as directory:
+            responses = self.run_service(scenario(os.path.join(directory, "service.sock")))
+        self.assertEqual([x["relatives"] for x in responses], [[6], None])
+
+    def test_failed_batch(self):
+        get_relationships = self.tree.get_relationships
+
+        def failing(member_ids, relationship_type):
+            if relationship_type == "son":
+                raise RuntimeError("boom")
+            return get_relationships(member_ids, relationship_type)
+
+        async def scenario():
+            service = RelationshipService(self.tree, max_in_flight=1)
+            server = await service.start()
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = await self.exchange(reader, writer, [
+                {"member_id": 6, "relationship": "son"},
+                {"member_id": 6, "relationship": "son"},
+                {"member_id": 6, "relationship": "siblings"},
+            ])
+            writer.close()
+            await service.close()
+            return responses
+
+        with patch.object(self.tree, "get_relationships", failing):
+            responses = self.run_service(scenario())
+        self.assertEqual(responses, [{"error": "Query failed: boom"},
+                                     {"error": "Query failed: boom"},
+                                     {"member_id": 6, "relationship": "siblings",
+                                      "relatives": [7]}])
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+from family_tree.member import Member
+from family_tree.shard import extract_subtree, find_components, find_lineages, partition
+from tests.unit.test_store import build_family
+
+
+def ids(members):
+    return sorted(member.id for member in members)
+
+
+class TestShard(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = build_family()
+        self.tree.add_member(Member(10, "Loner", "Male"))
+
+    def test_find_components(self):
+        self.assertEqual([ids(x) for x in find_components(self.tree)],
+                         [[1, 2, 3, 4, 5, 6, 7, 8, 9], [10]])
+
+    def test_find_lineages(self):
+        self.assertEqual(sorted(ids(x) for x in find_lineages(self.tree)),
+                         [[1, 2, 3, 4, 6, 7, 9], [5], [8], [10]])
+
+    def test_partition(self):
+        shards, assignment = partition(self.tree)
+        self.assertEqual([len(x.tree) for x in shards], [9, 1])
+        self.assertEqual([x.stubs for x in shards], [frozenset(), frozenset()])
+        self.assertEqual(assignment[9], 0)
+        self.assertEqual(assignment[10], 1)
+
+        shards, assignment = partition(self.tree, by="lineage")
+        shard = shards[assignment[1]]
+        self.assertEqual(shard.stubs, {5, 8})
+        self.assertEqual(len(shard.tree), 9)
+        self.assertEqual(shard.tree.get_member(6).father.id, 5)
+        self.assertEqual(shard.tree.get_member(5).children, [])
+        self.assertEqual(ids(shard.tree.get_relationship(9, "paternal_aunt")), [7])
+        self.assertEqual(len(shard.tree.to_store()), 9)
+
+        # copies are independent of the original tree
+        self.assertEqual(shard.tree.get_member(6) is self.tree.get_member(6), False)
+
+        # failure cases
+        self.assertRaises(ValueError, partition, self.tree, "surname")
+
+    def test_extract_subtree(self):
+        shard = extract_subtree(self.tree, 6, 1)
+        self.assertEqual(ids(shard.tree), [1, 2, 5, 6, 7, 8, 9])
+        self.assertEqual(shard.stubs, {1, 7})
+        self.assertEqual(ids(shard.tree.get_relationship(6, "siblings")), [7])
+        self.assertEqual(ids(extract_subtree(self.tree, 6, 0).tree), [2, 5, 6, 8, 9])
+
+        # failure cases
+        self.assertRaises(ValueError, extract_subtree, self.tree, 42, 1)
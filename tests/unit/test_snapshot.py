@@ -0,0 +1,88 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from family_tree.member import Member
+from family_tree.snapshot import dumps, loads, open_snapshot, save_snapshot
+from family_tree.tree import FamilyTree
+from tests.unit.test_store import build_family
+
+RELATIONSHIP_TYPES = ("paternal_aunt", "paternal_uncle", "maternal_aunt", "maternal_uncle",
+                      "brother_in_law", "sister_in_law", "son", "daughter", "siblings")
+
+
+class TestSnapshot(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = build_family()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "tree.snapshot")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_save_and_open(self):
+        save_snapshot(self.tree, self.path)
+        with open_snapshot(self.path) as snapshot:
+            store = snapshot.store
+            self.assertEqual(len(store), len(self.tree))
+            for member in self.tree:
+                view = store.get_member(member.id)
+                self.assertEqual(view.name, member.name)
+                self.assertEqual(view.gender, member.gender)
+                for relationship_type in RELATIONSHIP_TYPES:
+                    self.assertEqual(
+                        [x.id for x in view.get_relationship(relationship_type)],
+                        [x.id for x in member.get_relationship(relationship_type)])
+            self.assertEqual(store.get_member(42), None)
+        self.assertEqual(snapshot.store, None)
+
+    def test_close_with_children_held(self):
+        save_snapshot(self.tree, self.path)
+        snapshot = open_snapshot(self.path)
+        store = snapshot.store
+        children = store.children(store.index_of(1))
+        snapshot.close()
+        self.assertEqual(len(children), 3)
+        self.assertEqual(snapshot.mmap.closed, True)
+        self.assertEqual(snapshot.file.closed, True)
+
+    def test_close_with_view_held(self):
+        save_snapshot(self.tree, self.path)
+        snapshot = open_snapshot(self.path)
+        held = memoryview(snapshot.mmap)
+        self.assertRaises(BufferError, snapshot.close)
+        self.assertEqual(snapshot.file.closed, True)
+        held.release()
+        snapshot.close()
+        self.assertEqual(snapshot.mmap.closed, True)
+
+    def test_interned_names(self):
+        tree = FamilyTree()
+        for member_id in range(1, 4):
+            tree.add_member(Member(member_id, "Zim", "Male"))
+        tree.add_member(Member(4, "Zoë", "Female"))
+        store = loads(dumps(tree.to_store()))
+        self.assertEqual(list(store.names), ["Zim", "Zim", "Zim", "Zoë"])
+        self.assertEqual(list(store.names.name_ids), [0, 0, 0, 1])
+        self.assertEqual(bytes(store.names.name_data), "ZimZoë".encode("utf-8"))
+
+    def test_empty_tree(self):
+        store = loads(dumps(FamilyTree().to_store()))
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.get_member(1), None)
+
+    def test_round_trip(self):
+        # a loaded store can be written again unchanged
+        data = dumps(self.tree.to_store())
+        self.assertEqual(dumps(loads(data)), data)
+
+    def test_invalid_data(self):
+        self.assertRaises(ValueError, loads, b"\0" * 64)
+
+    def test_truncated_data(self):
+        data = dumps(self.tree.to_store())
+        for size in (0, 16, len(data) // 2, len(data) - 1):
+            with self.assertRaises(ValueError) as context:
+                loads(data[:size])
+            self.assertEqual(str(context.exception), "Truncated snapshot")
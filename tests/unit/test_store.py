@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+from family_tree.member import Member, Gender, Relationship
+from family_tree.store import ArrayStore, MemberView, NO_MEMBER
+from family_tree.tree import FamilyTree
+
+
+def build_family():
+    tree = FamilyTree()
+    grandmother = tree.add_member(Member(1, "GrandMother", "Female"))
+    mother = tree.add_member(Member(2, "Mother", "Female"))
+    aunt = tree.add_member(Member(3, "Aunt", "Female"))
+    uncle = tree.add_member(Member(4, "Uncle", "Male"))
+    father = tree.add_member(Member(5, "Father", "Male"))
+    member = tree.add_member(Member(6, "Zim", "Male"))
+    sister = tree.add_member(Member(7, "Sister", "Female"))
+    spouse = tree.add_member(Member(8, "Wife", "Female"))
+    son = tree.add_member(Member(9, "Son", "Male"))
+
+    for child in (mother, aunt, uncle):
+        child.set_mother(grandmother)
+        grandmother.add_child(child)
+    for child in (member, sister):
+        child.set_mother(mother)
+        child.set_father(father)
+        mother.add_child(child)
+        father.add_child(child)
+    mother.set_spouse(father)
+    father.set_spouse(mother)
+    member.set_spouse(spouse)
+    spouse.set_spouse(member)
+    son.set_father(member)
+    member.add_child(son)
+    return tree
+
+
+class TestArrayStore(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = build_family()
+        self.store = self.tree.to_store()
+
+    def test_from_tree(self):
+        self.assertEqual(len(self.store), 9)
+        self.assertEqual(list(self.store.ids), list(range(1, 10)))
+        index = self.store.index_of(6)
+        self.assertEqual(self.store.names[index], "Zim")
+        self.assertEqual(self.store.mothers[index], self.store.index_of(2))
+        self.assertEqual(self.store.fathers[index], self.store.index_of(5))
+        self.assertEqual(self.store.spouses[index], self.store.index_of(8))
+        self.assertEqual(list(self.store.children(index)), [self.store.index_of(9)])
+        self.assertEqual(self.store.index_of(42), NO_MEMBER)
+
+        # children outside the tree are rejected
+        outsider = Member(10, "Outsider", "Male")
+        self.tree.get_member(9).add_child(outsider)
+        self.assertRaises(ValueError, ArrayStore.from_tree, self.tree)
+
+    def test_member_view(self):
+        member = self.store.get_member(6)
+        self.assertEqual(isinstance(member, MemberView), True)
+        self.assertEqual(member.id, 6)
+        self.assertEqual(member.name, "Zim")
+        self.assertEqual(member.gender, Gender.male)
+        self.assertEqual(member.mother.name, "Mother")
+        self.assertEqual(member.father.name, "Father")
+        self.assertEqual(member.spouse.name, "Wife")
+        self.assertEqual([child.name for child in member.children], ["Son"])
+        self.assertEqual(member, self.store.get_member(6))
+        self.assertEqual(member.get_maternal_grandmother().name, "GrandMother")
+        self.assertEqual(member.get_paternal_grandmother(), None)
+        self.assertEqual(member.get_spouse_mother(), None)
+        self.assertEqual(self.store.get_member(42), None)
+
+    def test_get_relationship(self):
+        # the views answer exactly like the members they were built from
+        for member in self.tree:
+            view = self.store.get_member(member.id)
+            for relationship_type in ("paternal_aunt", "paternal_uncle", "maternal_aunt",
+                                      "maternal_uncle", "brother_in_law", "sister_in_law",
+                                      "son", "daughter", "siblings", "invalid_relation"):
+                self.assertEqual(
+                    [x.id for x in view.get_relationship(relationship_type)],
+                    [x.id for x in member.get_relationship(relationship_type)])
+
+        member = self.store.get_member(6)
+        self.assertEqual([x.name for x in member.get_maternal_aunt()], ["Aunt"])
+        self.assertEqual([x.name for x in member.get_maternal_uncle()], ["Uncle"])
+        self.assertEqual([x.name for x in member.get_siblings()], ["Sister"])
+        self.assertEqual([x.name for x in member.get_son()], ["Son"])
+        self.assertEqual(member.get_daughter(), [])
+        self.assertEqual([x.name for x in member.get_relationship(Relationship.son)], ["Son"])
+
+    def test_relatives_many(self):
+        indexes = [self.store.index_of(member_id) for member_id in (6, 7, 42)]
+        siblings = self.store.relatives_many(indexes, "siblings")
+        self.assertEqual(siblings, [[self.store.index_of(7)], [self.store.index_of(6)], []])
+        aunts = self.store.relatives_many(indexes, "maternal_aunt")
+        self.assertEqual(aunts, [[self.store.index_of(3)], [self.store.index_of(3)], []])
+        self.assertEqual(self.store.relatives_many(indexes, "invalid_relation"), [[], [], []])
@@ -0,0 +1,164 @@
+from unittest import TestCase
+
+from family_tree.member import Member
+from family_tree.transaction import Transaction, TransactionError
+from family_tree.tree import FamilyTree
+
+
+class TestTransaction(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = FamilyTree()
+        self.mother = self.tree.add_member(Member(1, "Mother", "Female"))
+        self.father = self.tree.add_member(Member(2, "Father", "Male"))
+
+    def add_child(self, transaction, child):
+        transaction.add_member(child)
+        transaction.set_mother(child.id, 1)
+        transaction.set_father(child.id, 2)
+        transaction.add_child(1, child.id)
+        transaction.add_child(2, child.id)
+
+    def assertRejected(self, transaction, message):
+        with self.assertRaises(TransactionError) as context:
+            transaction.commit()
+        self.assertIn(message, context.exception.errors)
+
+    def test_commit(self):
+        with self.tree.transaction() as transaction:
+            self.assertEqual(isinstance(transaction, Transaction), True)
+            transaction.set_spouse(1, 2)
+            transaction.set_spouse(2, 1)
+            self.add_child(transaction, Member(3, "Son", "Male"))
+            self.add_child(transaction, Member(4, "Daughter", "Female"))
+
+        son = self.tree.get_member(3)
+        self.assertEqual(son.mother, self.mother)
+        self.assertEqual(son.father, self.father)
+        self.assertEqual(self.mother.spouse, self.father)
+        self.assertEqual(self.father.spouse, self.mother)
+        self.assertEqual(self.father.get_son(), [son])
+        self.assertEqual([x.name for x in self.tree.get_relationship(3, "siblings")],
+                         ["Daughter"])
+
+    def test_commit_invalidates_cache(self):
+        self.assertEqual(self.tree.get_relationship(1, "son"), [])
+        with self.tree.transaction() as transaction:
+            self.add_child(transaction, Member(3, "Son", "Male"))
+        self.assertEqual(self.tree.get_relationship(1, "son"), [self.tree.get_member(3)])
+
+    def test_rollback(self):
+        with self.assertRaises(RuntimeError):
+            with self.tree.transaction() as transaction:
+                self.add_child(transaction, Member(3, "Son", "Male"))
+                raise RuntimeError("abort")
+        self.assertEqual(len(self.tree), 2)
+        self.assertEqual(self.mother.children, [])
+
+    def test_rejected_as_a_unit(self):
+        transaction = self.tree.transaction()
+        self.add_child(transaction, Member(3, "Son", "Male"))
+        transaction.set_spouse(1, 1)
+        self.assertRejected(transaction, "Invalid gender for spouse of 1")
+        self.assertEqual(len(self.tree), 2)
+        self.assertEqual(self.mother.children, [])
+
+    def test_validation_errors(self):
+        transaction = self.tree.transaction()
+        transaction.add_member(Member(1, "Duplicate", "Female"))
+        transaction.set_mother(2, 2)
+        transaction.set_father(1, 42)
+        with self.assertRaises(TransactionError) as context:
+            transaction.commit()
+        self.assertEqual(context.exception.errors, ["Member with id 1 already exists",
+                                                    "Mother of 2 should be a female!",
+                                                    "Unknown member id 42"])
+        self.assertRaises(ValueError, transaction.add_member, "member")
+
+    def test_bidirectional_consistency(self):
+        transaction = self.tree.transaction()
+        transaction.add_member(Member(3, "Son", "Male"))
+        transaction.set_mother(3, 1)
+        self.assertRejected(transaction, "3 is not listed as a child of 1")
+
+        transaction.add_member(Member(3, "Son", "Male"))
+        transaction.add_child(2, 3)
+        self.assertRejected(transaction, "3 does not have 2 as a parent")
+
+        transaction.set_spouse(1, 2)
+        self.assertRejected(transaction, "Spouse of 1 is not married to them")
+
+        transaction.add_member(Member(3, "Son", "Male"))
+        transaction.set_mother(3, 1)
+        transaction.add_child(1, 3)
+        transaction.add_child(1, 3)
+        self.assertRejected(transaction, "3 is already a child of 1")
+
+    def test_former_spouse(self):
+        other = self.tree.add_member(Member(3, "Other", "Male"))
+        self.tree.marry(self.father, self.mother)
+        transaction = self.tree.transaction()
+        transaction.set_spouse(1, 3)
+        transaction.set_spouse(3, 1)
+        self.assertRejected(transaction, "Former spouse 2 of 1 would still be married to them")
+        self.assertEqual(self.mother.spouse, self.father)
+
+        # accepted once the former spouse is remarried in the same transaction
+        second = self.tree.add_member(Member(4, "Second", "Female"))
+        with self.tree.transaction() as transaction:
+            transaction.set_spouse(1, 3)
+            transaction.set_spouse(3, 1)
+            transaction.set_spouse(2, 4)
+            transaction.set_spouse(4, 2)
+        self.assertEqual(self.mother.spouse, other)
+        self.assertEqual(self.father.spouse, second)
+        self.assertEqual(self.mother.children is self.father.children, False)
+
+    def test_cycles(self):
+        with self.tree.transaction() as transaction:
+            self.add_child(transaction, Member(3, "Daughter", "Female"))
+        transaction = self.tree.transaction()
+        transaction.set_mother(1, 3)
+        transaction.add_child(3, 1)
+        self.assertRejected(transaction, "1 would be their own ancestor")
+
+        transaction.set_mother(3, 3)
+        self.assertRejected(transaction, "3 already has a mother")
+
+    def test_long_chain(self):
+        # one pass over the staged links, however long the chain
+        tree = FamilyTree()
+        transaction = tree.transaction()
+        transaction.add_member(Member(0, "Root", "Female"))
+        for member_id in range(1, 20000):
+            transaction.add_member(Member(member_id, "Member", "Female"))
+            transaction.set_mother(member_id, member_id - 1)
+            transaction.add_child(member_id - 1, member_id)
+        transaction.set_mother(0, 19999)
+        transaction.add_child(19999, 0)
+        self.assertRejected(transaction, "0 would be their own ancestor")
+
+    def test_shared_children(self):
+        tree = FamilyTree()
+        husband = tree.add_member(Member(1, "Husband", "Male"))
+        wife = tree.add_member(Member(2, "Wife", "Female"))
+        tree.marry(husband, wife)
+        self.assertEqual(tree.get_relationship(1, "son"), [])
+
+        with tree.transaction() as transaction:
+            transaction.add_member(Member(3, "Son", "Male"))
+            transaction.set_mother(3, 2)
+            transaction.set_father(3, 1)
+            transaction.add_child(2, 3)
+            transaction.add_child(1, 3)
+        self.assertEqual([x.id for x in wife.children], [3])
+        self.assertEqual([x.id for x in tree.get_relationship(1, "son")], [3])
+
+        # listing the child under one parent lists it under both
+        with tree.transaction() as transaction:
+            transaction.add_member(Member(4, "Daughter", "Female"))
+            transaction.set_mother(4, 2)
+            transaction.set_father(4, 1)
+            transaction.add_child(2, 4)
+        self.assertEqual([x.id for x in husband.children], [3, 4])
+        self.assertEqual([x.id for x in tree.get_relationship(1, "daughter")], [4])
@@ -0,0 +1,98 @@
+import sys
+from unittest import TestCase
+
+from family_tree.member import Member
+from family_tree.traversal import (describe_relationship, find_common_ancestor,
+                                   get_parents, get_relation, iter_ancestors,
+                                   iter_cousins, iter_descendants, iter_neighbourhood)
+
+
+def add_child(mother, father, child):
+    child.set_mother(mother)
+    child.set_father(father)
+    mother.add_child(child)
+    father.add_child(child)
+    return child
+
+
+class TestTraversal(TestCase):
+
+    def setUp(self) -> None:
+        self.grandmother = Member(1, "GrandMother", "Female")
+        self.grandfather = Member(2, "GrandFather", "Male")
+        self.mother = add_child(self.grandmother, self.grandfather, Member(3, "Mother", "Female"))
+        self.uncle = add_child(self.grandmother, self.grandfather, Member(4, "Uncle", "Male"))
+        self.father = Member(5, "Father", "Male")
+        self.aunt_in_law = Member(6, "AuntInLaw", "Female")
+        self.member = add_child(self.mother, self.father, Member(7, "Zim", "Male"))
+        self.sister = add_child(self.mother, self.father, Member(8, "Sister", "Female"))
+        self.cousin = add_child(self.aunt_in_law, self.uncle, Member(9, "Cousin", "Female"))
+        self.son = Member(10, "Son", "Male")
+        self.son.set_father(self.member)
+        self.member.add_child(self.son)
+
+    def test_get_parents(self):
+        self.assertEqual(get_parents(self.member), [self.mother, self.father])
+        self.assertEqual(get_parents(self.grandmother), [])
+
+    def test_iter_ancestors(self):
+        ancestors = [(x.name, depth) for x, depth in iter_ancestors(self.member)]
+        self.assertEqual(ancestors, [("Mother", 1), ("Father", 1),
+                                     ("GrandMother", 2), ("GrandFather", 2)])
+        self.assertEqual(len(list(iter_ancestors(self.member, max_depth=1))), 2)
+
+    def test_iter_descendants(self):
+        # children listed under both parents are yielded once
+        descendants = [x.name for x, depth in iter_descendants(self.grandmother)]
+        self.assertEqual(descendants, ["Mother", "Uncle", "Zim", "Sister", "Cousin", "Son"])
+        self.assertEqual(len(list(iter_descendants(self.grandmother, max_depth=1))), 2)
+
+    def test_iter_neighbourhood(self):
+        neighbours = [(x.name, depth) for x, depth in iter_neighbourhood(self.mother, 1)]
+        self.assertEqual(neighbours, [("GrandMother", 1), ("GrandFather", 1),
+                                      ("Zim", 1), ("Sister", 1)])
+        self.assertEqual(len(list(iter_neighbourhood(self.mother))), 9)
+
+    def test_deep_tree(self):
+        member = Member(0, "Root", "Female")
+        root = member
+        for index in range(1, sys.getrecursionlimit() * 2):
+            child = Member(index, "Child", "Female")
+            child.set_mother(member)
+            member.add_child(child)
+            member = child
+        self.assertEqual(sum(1 for _ in iter_ancestors(member)), sys.getrecursionlimit() * 2 - 1)
+        self.assertEqual(find_common_ancestor(member, root)[0], root)
+
+    def test_find_common_ancestor(self):
+        ancestor, up, down = find_common_ancestor(self.member, self.cousin)
+        self.assertEqual(ancestor, self.grandmother)
+        self.assertEqual((up, down), (2, 2))
+        self.assertEqual(find_common_ancestor(self.son, self.mother)[1:], (2, 0))
+        self.assertEqual(find_common_ancestor(self.member, self.aunt_in_law), None)
+        self.assertEqual(find_common_ancestor(self.member, self.cousin, max_depth=1), None)
+
+    def test_iter_cousins(self):
+        self.assertEqual(list(iter_cousins(self.member)), [self.cousin])
+        self.assertEqual(list(iter_cousins(self.cousin)), [self.member, self.sister])
+        self.assertEqual(list(iter_cousins(self.member, degree=2)), [])
+
+    def test_get_relation(self):
+        self.assertEqual(get_relation(self.member, self.member), "self")
+        self.assertEqual(get_relation(self.member, self.mother), "parent")
+        self.assertEqual(get_relation(self.member, self.grandmother), "grandparent")
+        self.assertEqual(get_relation(self.member, self.sister), "sibling")
+        self.assertEqual(get_relation(self.member, self.uncle), "aunt/uncle")
+        self.assertEqual(get_relation(self.uncle, self.member), "niece/nephew")
+        self.assertEqual(get_relation(self.member, self.cousin), "cousin of degree 1")
+        self.assertEqual(get_relation(self.son, self.cousin), "cousin of degree 1 once removed")
+        self.assertEqual(get_relation(self.grandmother, self.son), "great-grandchild")
+        self.assertEqual(get_relation(self.member, self.aunt_in_law), None)
+
+    def test_describe_relationship(self):
+        self.assertEqual(describe_relationship(4, 0), "great-great-grandparent")
+        self.assertEqual(describe_relationship(0, 3), "great-grandchild")
+        self.assertEqual(describe_relationship(3, 1), "grandaunt/granduncle")
+        self.assertEqual(describe_relationship(1, 3), "grandniece/grandnephew")
+        self.assertEqual(describe_relationship(3, 3), "cousin of degree 2")
+        self.assertEqual(describe_relationship(2, 5), "cousin of degree 1 3 times removed")
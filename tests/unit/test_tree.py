@@ -0,0 +1,205 @@
+from unittest import TestCase
+
+from family_tree.member import Member, Gender, Relationship
+from family_tree.tree import FamilyTree
+from family_tree.validate import validate
+
+
+class TestFamilyTree(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = FamilyTree()
+        self.member = self.tree.add_member(Member(1, "Zim", "Male"))
+        self.mother = self.tree.add_member(Member(2, "Mother", "Female"))
+
+    def test_add_member(self):
+        self.assertEqual(len(self.tree), 2)
+        self.assertEqual(1 in self.tree, True)
+        self.assertEqual(3 in self.tree, False)
+        self.assertEqual(list(self.tree), [self.member, self.mother])
+
+        # failure cases
+        self.assertRaises(ValueError, self.tree.add_member, "member")
+        self.assertRaises(ValueError, self.tree.add_member, Member(1, "Other", "Male"))
+
+    def test_get_member(self):
+        self.assertEqual(self.tree.get_member(1), self.member)
+        self.assertEqual(self.tree.get_member(2), self.mother)
+        self.assertEqual(self.tree.get_member(3), None)
+
+    def test_get_members_by_name(self):
+        namesake = self.tree.add_member(Member(3, "Zim", "Male"))
+        self.assertEqual(self.tree.get_members_by_name("Zim"), [self.member, namesake])
+        self.assertEqual(self.tree.get_members_by_name("Nobody"), [])
+        self.assertEqual(self.tree.get_member_by_name("Zim"), self.member)
+        self.assertEqual(self.tree.get_member_by_name("Nobody"), None)
+
+    def test_find_members(self):
+        namesake = self.tree.add_member(Member(3, "".join(["Z", "im"]), "Male"))
+        zimbo = self.tree.add_member(Member(4, "zimbo", "Male"))
+        self.assertEqual(namesake.name is self.member.name, True)
+        self.assertEqual(self.tree.find_members("Zim"), [self.member, namesake])
+        self.assertEqual(self.tree.find_members("Zim", limit=1), [self.member])
+        self.assertEqual(self.tree.find_members("zim"), [])
+        self.assertEqual(self.tree.find_members("zim", ignore_case=True),
+                         [self.member, namesake])
+        self.assertEqual(self.tree.find_members("Zi", prefix=True), [self.member, namesake])
+        self.assertEqual(self.tree.find_members("ZI", prefix=True, ignore_case=True),
+                         [self.member, namesake, zimbo])
+        self.assertEqual(self.tree.find_members("z", prefix=True, ignore_case=True, limit=1),
+                         [self.member])
+
+        # the index follows added and removed members without a rebuild
+        index = self.tree._names
+        self.tree.add_member(Member(6, "Zim", "Male"))
+        self.assertEqual(self.tree._names is index, True)
+        self.tree.remove_member(6)
+        self.tree.remove_member(4)
+        mo = self.tree.add_member(Member(5, "Mo", "Female"))
+        self.assertEqual(self.tree.find_members("ZI", prefix=True, ignore_case=True),
+                         [self.member, namesake])
+        self.assertEqual(self.tree.find_members("M", prefix=True), [mo, self.mother])
+
+    def test_get_members_by_gender(self):
+        self.assertEqual(self.tree.get_members_by_gender("Male"), [self.member])
+        self.assertEqual(self.tree.get_members_by_gender(Gender.female), [self.mother])
+
+    def test_get_relationship(self):
+        son = self.tree.add_member(Member(3, "Son", "Male"))
+        self.member.add_child(son)
+        self.assertEqual(self.tree.get_relationship(1, "son"), [son])
+        self.assertEqual(self.tree.get_relationship(1, "daughter"), [])
+        self.assertEqual(self.tree.get_relationship(42, "son"), None)
+
+    def test_get_relationship_cache(self):
+        father = self.tree.add_member(Member(3, "Father", "Male"))
+        grandmother = self.tree.add_member(Member(4, "GrandMother", "Female"))
+        aunt = self.tree.add_member(Member(5, "Aunt", "Female"))
+        self.member.set_father(father)
+        father.set_mother(grandmother)
+        grandmother.add_child(father)
+
+        self.assertEqual(self.tree.get_relationship(1, "paternal_aunt"), [])
+        self.assertEqual(self.tree.get_relationship(1, "son"), [])
+        self.assertEqual((1, "paternal_aunt") in self.tree.cache, True)
+        self.assertEqual(self.tree.get_relationship(1, "paternal_aunt"), [])
+        self.assertEqual(self.tree.cache.hits, 1)
+
+        # only results read from the grandmother are dropped
+        grandmother.add_child(aunt)
+        self.assertEqual((1, "paternal_aunt") in self.tree.cache, False)
+        self.assertEqual((1, "son") in self.tree.cache, True)
+        self.assertEqual(self.tree.get_relationship(1, "paternal_aunt"), [aunt])
+
+    def test_get_relationships(self):
+        daughter = self.tree.add_member(Member(3, "Daughter", "Female"))
+        son = self.tree.add_member(Member(4, "Son", "Male"))
+        for child in (daughter, son):
+            child.set_mother(self.mother)
+            self.mother.add_child(child)
+
+        self.assertEqual(self.tree.get_relationships([3, 4, 42], "siblings"),
+                         {3: [son], 4: [daughter], 42: None})
+        self.assertEqual(self.tree.get_relationships([2], "son"), {2: [son]})
+
+        # after a mutation batches are answered from the members until they
+        # have cost about a rebuild of the array copy
+        other = self.tree.add_member(Member(5, "Other", "Male"))
+        other.set_mother(self.mother)
+        self.mother.add_child(other)
+        self.assertEqual(self.tree.get_relationships([2], "son"), {2: [son, other]})
+        self.assertEqual(self.tree._store, None)
+        self.assertEqual(self.tree.get_relationships([3, 4, 42], "siblings"),
+                         {3: [son, other], 4: [daughter, other], 42: None})
+        self.assertEqual(self.tree._store, None)
+        self.assertEqual(self.tree.get_relationships([1, 2], "son"), {1: [], 2: [son, other]})
+        self.assertEqual(self.tree._store is None, False)
+
+    def test_get_relationship_enum(self):
+        son = self.tree.add_member(Member(3, "Son", "Male"))
+        self.member.add_child(son)
+        self.assertEqual(self.tree.get_relationship(1, Relationship.son), [son])
+        self.assertEqual((1, "son") in self.tree.cache, True)
+        self.assertEqual(self.tree.get_relationships([1], Relationship.son), {1: [son]})
+        self.assertEqual(self.tree.get_relationship(1, "cousin"), [])
+        self.assertRaises(ValueError, self.tree.get_relationship, 1, "cousin", strict=True)
+        self.assertRaises(ValueError, self.tree.get_relationships, [1], "cousin", strict=True)
+
+    def test_marry_and_link_child(self):
+        self.tree.marry(self.member, self.mother)
+        self.assertEqual(self.member.spouse, self.mother)
+        self.assertEqual(self.mother.spouse, self.member)
+        self.assertEqual(self.member.children is self.mother.children, True)
+
+        self.assertEqual(self.tree.get_relationship(1, "son"), [])
+        son = self.tree.add_member(Member(3, "Son", "Male"))
+        self.tree.link_child(self.mother, self.member, son)
+        self.assertEqual(son.mother, self.mother)
+        self.assertEqual(son.father, self.member)
+        self.assertEqual(list(self.mother.children), [son])
+        self.assertEqual(self.tree.get_relationship(1, "son"), [son])
+        self.assertEqual(self.tree.get_relationship(2, "son"), [son])
+
+        # a remarried parent keeps their own children list
+        daughter = self.tree.add_member(Member(4, "Daughter", "Female"))
+        husband = self.tree.add_member(Member(5, "Husband", "Male"))
+        self.tree.marry(husband, self.mother)
+        self.assertEqual(husband.children is self.mother.children, False)
+        self.tree.link_child(self.mother, husband, daughter)
+        self.assertEqual(list(husband.children), [daughter])
+        self.assertEqual(list(self.mother.children), [son, daughter])
+
+        # failure cases
+        self.assertRaises(ValueError, self.tree.link_child, self.member, None, daughter)
+        self.assertRaises(ValueError, self.tree.marry, self.member, husband)
+        self.assertRaises(ValueError, self.tree.marry, self.member, "spouse")
+
+    def test_shared_children_invalidate_both_parents(self):
+        self.tree.marry(self.member, self.mother)
+        self.assertEqual(self.tree.get_relationship(1, "son"), [])
+        son = self.tree.add_member(Member(3, "Son", "Male"))
+        self.mother.add_child(son)
+        self.assertEqual(self.tree.get_relationship(1, "son"), [son])
+
+    def test_link_child_of_another_father(self):
+        self.tree.marry(self.member, self.mother)
+        other = self.tree.add_member(Member(3, "Other", "Male"))
+        daughter = self.tree.add_member(Member(4, "Daughter", "Female"))
+        self.tree.link_child(self.mother, other, daughter)
+        self.assertEqual(self.member.get_daughter(), [])
+        self.assertEqual(self.tree.get_relationship(3, "daughter"), [daughter])
+        self.assertEqual(self.tree.get_relationship(2, "daughter"), [daughter])
+        self.assertEqual(validate(self.tree), [])
+
+    def test_set_spouse_unshares_children(self):
+        self.tree.marry(self.member, self.mother)
+        self.assertEqual(self.tree.get_relationship(1, "daughter"), [])
+        other = self.tree.add_member(Member(3, "Other", "Male"))
+        self.mother.set_spouse(other)
+        self.assertEqual(self.mother.children is self.member.children, False)
+        daughter = self.tree.add_member(Member(4, "Daughter", "Female"))
+        self.mother.add_child(daughter)
+        self.assertEqual(self.member.get_daughter(), [])
+        self.assertEqual(self.tree.get_relationship(1, "daughter"), [])
+
+    def test_remarry(self):
+        self.tree.marry(self.member, self.mother)
+        second = self.tree.add_member(Member(3, "Second", "Female"))
+        self.tree.marry(self.member, second)
+        self.assertEqual(self.mother.spouse, None)
+        self.assertEqual(self.member.spouse, second)
+        self.assertEqual(self.mother.children is self.member.children, False)
+        self.assertEqual(second.children is self.member.children, True)
+
+        son = self.tree.add_member(Member(4, "Son", "Male"))
+        self.tree.link_child(second, self.member, son)
+        self.assertEqual(self.tree.get_relationship(1, "son"), [son])
+        self.assertEqual(self.tree.get_relationship(2, "son"), [])
+
+        # children of the first marriage stay with both parents, apart from the next one
+        third = self.tree.add_member(Member(5, "Third", "Female"))
+        self.tree.marry(self.member, third)
+        self.assertEqual(list(second.children), [son])
+        self.assertEqual(list(self.member.children), [son])
+        self.assertEqual(third.children is self.member.children, False)
+        self.assertEqual(second.spouse, None)
@@ -0,0 +1,81 @@
+import sys
+from unittest import TestCase
+
+from family_tree.member import Member
+from family_tree.validate import (Validator, Violation, validate, ASYMMETRIC_SPOUSE,
+                                  CHILD_PARENT_MISMATCH, CYCLE, FATHER_GENDER,
+                                  MOTHER_GENDER, UNLISTED_CHILD)
+from tests.unit.test_store import build_family
+
+
+class TestValidate(TestCase):
+
+    def setUp(self) -> None:
+        self.tree = build_family()
+        self.members = self.tree.members
+
+    def test_valid_tree(self):
+        self.assertEqual(validate(self.tree), [])
+        self.assertEqual(Validator().attach(self.tree).check(), [])
+
+    def test_violations(self):
+        grandmother, mother, member, son = (self.members[x] for x in (1, 2, 6, 9))
+        mother.mother = son
+        son.children.append(mother)
+        member.father = self.members[7]
+        self.members[8].spouse = None
+        self.members[3].children.append(son)
+
+        self.assertEqual(sorted(validate(self.tree)), sorted([
+            Violation(CYCLE, 6, 2),
+            Violation(CYCLE, 7, 2),
+            Violation(MOTHER_GENDER, 2, 9),
+            Violation(FATHER_GENDER, 6, 7),
+            Violation(UNLISTED_CHILD, 6, 7),
+            Violation(ASYMMETRIC_SPOUSE, 6, 8),
+            Violation(CHILD_PARENT_MISMATCH, 1, 2),
+            Violation(CHILD_PARENT_MISMATCH, 3, 9),
+            Violation(CHILD_PARENT_MISMATCH, 5, 6),
+        ]))
+        self.assertEqual(grandmother.children[0] is mother, True)
+
+        member.mother = self.members[4]
+        self.assertEqual(Violation(MOTHER_GENDER, 6, 4) in validate([member]), True)
+
+    def test_deep_cycle(self):
+        members = [Member(x, "Member{}".format(x), "Female")
+                   for x in range(sys.getrecursionlimit() * 2)]
+        for child, mother in zip(members, members[1:]):
+            child.mother = mother
+            mother.children.append(child)
+        members[-1].mother = members[0]
+        members[0].children.append(members[-1])
+        self.assertEqual(validate(members), [Violation(CYCLE, len(members) - 1, 0)])
+
+    def test_many_children(self):
+        mother = Member(0, "Mother", "Female")
+        for member_id in range(1, 50001):
+            child = Member(member_id, "Child", "Male")
+            child.mother = mother
+            mother.children.append(child)
+        members = [mother] + list(mother.children)
+        self.assertEqual(validate(members), [])
+        mother.children.pop()
+        self.assertEqual(validate(members), [Violation(UNLISTED_CHILD, 50000, 0)])
+
+    def test_incremental(self):
+        validator = Validator().attach(self.tree)
+        self.assertEqual(validator.check(), [])
+
+        daughter = self.tree.add_member(Member(10, "Daughter", "Female"))
+        daughter.set_mother(self.members[8])
+        self.assertEqual(validator.touched, {8, 10})
+        self.assertEqual(validator.check(), [Violation(UNLISTED_CHILD, 10, 8)])
+        self.assertEqual(validator.check(), [])
+
+        self.members[8].add_child(daughter)
+        self.assertEqual(validator.check(), [])
+
+        validator.detach()
+        self.tree.add_member(Member(11, "Other", "Male"))
+        self.assertEqual(validator.touched, set())